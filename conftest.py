@@ -0,0 +1,33 @@
+"""
+Shared pytest fixtures for the test scripts.
+
+The test scripts also run standalone (python test_*.py); their main()
+functions pass the same kind of objects these fixtures provide.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from testutils import get_shared_loader
+
+
+@pytest.fixture(scope="session")
+def shared_loader():
+    """RDF loader with the ontology files, loaded once per test session."""
+    return get_shared_loader()
+
+
+@pytest.fixture
+def client():
+    """Flask test client for the REST API, one per test."""
+    # Imported here so the validator and query tests don't need Flask
+    from ontology.api import create_app
+    
+    app = create_app({'TESTING': True})
+    with app.test_client() as test_client:
+        yield test_client
@@ -31,6 +31,12 @@ from datetime import datetime
 from flask import Flask, request, jsonify, Response
 from flask_cors import CORS
 
+try:
+    import orjson
+except ImportError:
+    # Optional: responses fall back to Flask's stdlib-based jsonify
+    orjson = None
+
 try:
     from ontology.loader import RDFLoader, load_ontology_files
     from ontology.query import SPARQLQueryEngine
@@ -81,6 +87,38 @@ def initialize_components():
     logger.info("API components initialized successfully")
 
 
+def _components_status() -> Dict[str, str]:
+    """Report whether each API component has been initialized."""
+    return {
+        'rdf_loader': 'initialized' if rdf_loader else 'not_initialized',
+        'query_engine': 'initialized' if query_engine else 'not_initialized',
+        'validator': 'initialized' if validator else 'not_initialized'
+    }
+
+
+def ojson(payload: Any, status: int = 200) -> Response:
+    """
+    Serialize a payload to a JSON response, using orjson when available.
+    
+    Args:
+        payload: JSON-serializable data
+        status: HTTP status code
+    
+    Returns:
+        Flask Response with an application/json body
+    """
+    if orjson is None:
+        response = jsonify(payload)
+        response.status_code = status
+        return response
+    
+    return app.response_class(
+        orjson.dumps(payload),
+        status=status,
+        mimetype='application/json'
+    )
+
+
 def create_success_response(
     message: str,
     data: Optional[Dict[str, Any]] = None,
@@ -106,7 +144,7 @@ def create_success_response(
     if data is not None:
         response['data'] = data
     
-    return jsonify(response), status_code
+    return ojson(response), status_code
 
 
 def create_error_response(
@@ -139,7 +177,7 @@ def create_error_response(
     if details is not None:
         response['error']['details'] = details
     
-    return jsonify(response), status_code
+    return ojson(response), status_code
 
 
 # ============================================================================
@@ -178,11 +216,7 @@ def health_check():
     """
     try:
         # Check component status
-        components_status = {
-            'rdf_loader': 'initialized' if rdf_loader else 'not_initialized',
-            'query_engine': 'initialized' if query_engine else 'not_initialized',
-            'validator': 'initialized' if validator else 'not_initialized'
-        }
+        components_status = _components_status()
         
         # Gather statistics
         statistics = {}
@@ -227,6 +261,104 @@ def health_check():
         )
 
 
+# Queries run by /diagnostics, matching the graph explorer verification checks
+DIAGNOSTICS_PROBE_QUERY = "SELECT ?s ?p ?o WHERE { ?s ?p ?o } LIMIT 1"
+DIAGNOSTICS_OWL_CLASS_QUERY = """
+PREFIX owl: <http://www.w3.org/2002/07/owl#>
+PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+
+SELECT ?class ?label WHERE {
+    ?class a owl:Class .
+    OPTIONAL { ?class rdfs:label ?label }
+} LIMIT 10
+"""
+
+
+@app.route('/diagnostics', methods=['GET'])
+def diagnostics():
+    """
+    Collect everything the graph explorer integration depends on in one call.
+    
+    Combines the health check, the loaded data summary and the SPARQL
+    probes that would otherwise take separate requests.
+    
+    Returns:
+        JSON response with diagnostics
+    
+    Example:
+        GET /diagnostics
+        
+        Response:
+        {
+            "success": true,
+            "message": "Diagnostics collected",
+            "data": {
+                "status": "healthy",
+                "components": {...},
+                "loaded_files": ["ontology/core.ttl"],
+                "file_count": 1,
+                "sparql_format_ok": true,
+                "owl_class_count": 10
+            }
+        }
+    """
+    try:
+        components_status = _components_status()
+        all_initialized = all(
+            status == 'initialized'
+            for status in components_status.values()
+        )
+        
+        data = {
+            'status': 'healthy' if all_initialized else 'degraded',
+            'components': components_status,
+            'loaded_files': [],
+            'file_count': 0
+        }
+        
+        if rdf_loader:
+            loaded_files = rdf_loader.get_loaded_files()
+            data['loaded_files'] = loaded_files
+            data['file_count'] = len(loaded_files)
+        
+        if query_engine:
+            # A failing probe is reported in the payload rather than failing
+            # the whole diagnostics request
+            try:
+                probe = query_engine.execute(
+                    DIAGNOSTICS_PROBE_QUERY,
+                    output_format='sparql_json'
+                )
+                data['sparql_format_ok'] = 'head' in probe and 'results' in probe
+                
+                owl_classes = query_engine.execute(
+                    DIAGNOSTICS_OWL_CLASS_QUERY,
+                    output_format='sparql_json'
+                )
+                data['owl_class_count'] = len(
+                    owl_classes.get('results', {}).get('bindings', [])
+                )
+            except Exception as e:
+                logger.warning(f"Diagnostics query failed: {str(e)}")
+                data['sparql_format_ok'] = False
+                data['owl_class_count'] = 0
+                data['sparql_error'] = str(e)
+        
+        return create_success_response(
+            message='Diagnostics collected',
+            data=data
+        )
+        
+    except Exception as e:
+        logger.error(f"Diagnostics failed: {str(e)}")
+        return create_error_response(
+            message='Diagnostics failed',
+            error_type='DiagnosticsError',
+            details=str(e),
+            status_code=500
+        )
+
+
 @app.route('/load', methods=['POST'])
 def load_turtle_files():
     """
@@ -438,7 +570,7 @@ def execute_sparql_query():
         if output_format == 'sparql_json':
             # Return standard SPARQL JSON results format
             # This is what graph-explorer expects
-            return jsonify(results), 200
+            return ojson(results), 200
         else:
             # Return custom format with metadata
             return create_success_response(
@@ -523,7 +655,7 @@ def run_shacl_validation():
             validator.load_shapes(shapes_file)
         
         # Check if shapes are loaded
-        if not validator.get_loaded_shapes():
+        if not validator.shape_count:
             return create_error_response(
                 message='No SHACL shapes loaded',
                 error_type='ValidationError',
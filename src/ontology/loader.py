@@ -84,6 +84,9 @@ class RDFLoader:
         self.triples: List = []
         self.loaded_files: List[str] = []
         self.namespaces: Dict[str, str] = {}
+        # Shared term pool so identical IRIs declared across files are
+        # stored as a single string object
+        self._terms: Dict[str, str] = {}
         logger.info("RDF Loader initialized")
     
     def load_file(self, file_path: Union[str, Path], validate: bool = True) -> bool:
@@ -290,6 +293,18 @@ class RDFLoader:
         
         logger.debug(f"Turtle syntax validation passed for {file_path}")
     
+    def _intern(self, term: str) -> str:
+        """
+        Return the pooled instance of a term, adding it to the pool if new.
+        
+        Args:
+            term: IRI or prefix string
+        
+        Returns:
+            The canonical string object for the term
+        """
+        return self._terms.setdefault(term, term)
+    
     def _extract_namespaces(self, content: str) -> None:
         """
         Extract namespace prefixes from Turtle content.
@@ -307,8 +322,8 @@ class RDFLoader:
                 try:
                     parts = line.split()
                     if len(parts) >= 3:
-                        prefix = parts[1].rstrip(':')
-                        namespace = parts[2].strip('<>').rstrip('.')
+                        prefix = self._intern(parts[1].rstrip(':'))
+                        namespace = self._intern(parts[2].strip('<>').rstrip('.'))
                         self.namespaces[prefix] = namespace
                         logger.debug(f"Registered namespace: {prefix} -> {namespace}")
                 except Exception as e:
@@ -376,6 +391,7 @@ class RDFLoader:
         self.triples.clear()
         self.loaded_files.clear()
         self.namespaces.clear()
+        self._terms.clear()
         logger.info("RDF Loader cleared")
     
     def get_triple_count(self) -> int:
@@ -43,9 +43,12 @@ Example Usage:
     results = engine.execute(query, timeout=10.0)
 """
 
+import bisect
 import logging
+import re
 import time
-from typing import Dict, List, Any, Optional, Union
+from types import MappingProxyType
+from typing import Dict, List, Any, NamedTuple, Optional, Union
 from enum import Enum
 import json
 
@@ -72,6 +75,42 @@ class QueryType(Enum):
     UNKNOWN = "UNKNOWN"
 
 
+# Leading query form, after any comments and PREFIX/BASE declarations
+_QTYPE_RE = re.compile(
+    r"""
+    \s*
+    (?:
+        (?: \#[^\n]*
+          | PREFIX \s+ [^\s:]* : \s* <[^>]*>
+          | BASE \s* <[^>]*>
+        ) \s*
+    )*
+    (SELECT|CONSTRUCT|ASK|DESCRIBE) \b
+    """,
+    re.IGNORECASE | re.VERBOSE
+)
+
+
+# Timeouts by dataset size: under 10k triples 5 seconds, under 100k triples
+# 15 seconds
+_TIMEOUT_THRESHOLDS = (10_000, 100_000)
+_TIMEOUT_STEPS = (5.0, 15.0)
+
+
+# SPARQL features the engine supports (upper case, as checked)
+_SUPPORTED_FEATURES = frozenset({
+    'SELECT', 'CONSTRUCT', 'ASK', 'DESCRIBE',
+    'FILTER', 'OPTIONAL', 'UNION', 'LIMIT', 'OFFSET',
+    'ORDER BY', 'DISTINCT', 'REDUCED'
+})
+
+
+class PreparedQuery(NamedTuple):
+    """A query whose syntax has been validated and whose type is known."""
+    query: str
+    query_type: QueryType
+
+
 class SPARQLQueryError(Exception):
     """Base exception for SPARQL query errors."""
     pass
@@ -129,34 +168,26 @@ class SPARQLQueryEngine:
         logger.info("RDF loader updated")
 
     
-    def _detect_query_type(self, query: str) -> QueryType:
+    @staticmethod
+    def _detect_query_type(query: str) -> QueryType:
         """
         Detect the type of SPARQL query.
         
+        Leading comments and PREFIX/BASE declarations are skipped.
+        
         Args:
             query: SPARQL query string
         
         Returns:
             QueryType enum value
         """
-        query_upper = query.strip().upper()
-        
-        # Remove comments
-        lines = [line.split('#')[0] for line in query_upper.split('\n')]
-        query_clean = ' '.join(lines).strip()
-        
-        if query_clean.startswith('SELECT'):
-            return QueryType.SELECT
-        elif query_clean.startswith('CONSTRUCT'):
-            return QueryType.CONSTRUCT
-        elif query_clean.startswith('ASK'):
-            return QueryType.ASK
-        elif query_clean.startswith('DESCRIBE'):
-            return QueryType.DESCRIBE
-        else:
+        match = _QTYPE_RE.match(query)
+        if match is None:
             return QueryType.UNKNOWN
+        return QueryType[match.group(1).upper()]
     
-    def _validate_query_syntax(self, query: str) -> None:
+    @staticmethod
+    def _validate_query_syntax(query: str) -> None:
         """
         Perform basic validation of SPARQL query syntax.
         
@@ -171,7 +202,7 @@ class SPARQLQueryEngine:
         if not query_stripped:
             raise QuerySyntaxError("Query cannot be empty")
         
-        query_type = self._detect_query_type(query)
+        query_type = SPARQLQueryEngine._detect_query_type(query)
         
         if query_type == QueryType.UNKNOWN:
             raise QuerySyntaxError(
@@ -207,14 +238,11 @@ class SPARQLQueryEngine:
         if triple_count is None:
             return self.default_timeout
         
-        # For datasets under 10k triples, use 5 seconds
-        if triple_count < 10000:
-            return 5.0
-        # For larger datasets, scale timeout
-        elif triple_count < 100000:
-            return 15.0
-        else:
-            return self.default_timeout
+        # Datasets at or above the last threshold use the default timeout
+        step = bisect.bisect_right(_TIMEOUT_THRESHOLDS, triple_count)
+        if step < len(_TIMEOUT_STEPS):
+            return _TIMEOUT_STEPS[step]
+        return self.default_timeout
     
     def execute(
         self,
@@ -240,15 +268,56 @@ class SPARQLQueryEngine:
             QueryTimeoutError: If the query exceeds the timeout
             QueryExecutionError: If query execution fails
         """
+        if validate:
+            self._validate_query_syntax(query)
+        
+        prepared = PreparedQuery(query, self._detect_query_type(query))
+        return self.execute_prepared(prepared, timeout=timeout, output_format=output_format)
+    
+    @staticmethod
+    def prepare(query: str) -> PreparedQuery:
+        """
+        Validate a query and detect its type once, for repeated execution.
+        
+        Args:
+            query: SPARQL query string
+        
+        Returns:
+            PreparedQuery to pass to execute_prepared
+        
+        Raises:
+            QuerySyntaxError: If the query syntax is invalid
+        """
+        SPARQLQueryEngine._validate_query_syntax(query)
+        return PreparedQuery(query, SPARQLQueryEngine._detect_query_type(query))
+    
+    def execute_prepared(
+        self,
+        prepared: PreparedQuery,
+        timeout: Optional[float] = None,
+        output_format: str = 'python'
+    ) -> Union[Dict, List, bool, str]:
+        """
+        Execute a query prepared with prepare(), skipping validation and
+        type detection.
+        
+        Args:
+            prepared: PreparedQuery from prepare()
+            timeout: Query timeout in seconds (None for auto-calculation)
+            output_format: Output format ('python', 'json', 'turtle')
+        
+        Returns:
+            Query results in the specified format
+        
+        Raises:
+            QuerySyntaxError: If the query type is not supported
+            QueryTimeoutError: If the query exceeds the timeout
+            QueryExecutionError: If query execution fails
+        """
+        query, query_type = prepared
         start_time = time.time()
         
         try:
-            # Validate syntax if requested
-            if validate:
-                self._validate_query_syntax(query)
-            
-            # Detect query type
-            query_type = self._detect_query_type(query)
             logger.info(f"Executing {query_type.value} query")
             
             # Calculate timeout
@@ -709,13 +778,7 @@ class SPARQLQueryEngine:
         Returns:
             True if the feature is supported
         """
-        supported_features = {
-            'SELECT', 'CONSTRUCT', 'ASK', 'DESCRIBE',
-            'FILTER', 'OPTIONAL', 'UNION', 'LIMIT', 'OFFSET',
-            'ORDER BY', 'DISTINCT', 'REDUCED'
-        }
-        
-        return feature.upper() in supported_features
+        return feature.upper() in _SUPPORTED_FEATURES
 
 
 def create_query_engine(
@@ -763,7 +826,7 @@ def create_query_engine(
 
 
 # Example queries for testing
-EXAMPLE_QUERIES = {
+EXAMPLE_QUERIES = MappingProxyType({
     'select_all': '''
         SELECT ?subject ?predicate ?object
         WHERE {
@@ -804,7 +867,13 @@ EXAMPLE_QUERIES = {
     'describe_resource': '''
         DESCRIBE <http://example.org/ontology#Entity>
     '''
-}
+})
+
+# Example queries validated once at import, for execute_prepared
+PREPARED_EXAMPLE_QUERIES = MappingProxyType({
+    name: SPARQLQueryEngine.prepare(query)
+    for name, query in EXAMPLE_QUERIES.items()
+})
 
 
 if __name__ == "__main__":
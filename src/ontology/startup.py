@@ -9,10 +9,12 @@ This script is executed before the API server starts to ensure all ontology
 data is available when the service becomes ready.
 """
 
+import hashlib
 import logging
+import os
 import sys
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 # Configure logging
 logging.basicConfig(
@@ -21,8 +23,47 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Digest of the namespace map from the previous startup, used to avoid
+# re-logging an identical prefix list on every container restart. Kept in
+# the per-user cache directory; ONTOLOGY_NS_DIGEST_FILE overrides the path
+NAMESPACE_DIGEST_FILE = Path(os.environ.get(
+    'ONTOLOGY_NS_DIGEST_FILE',
+    Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache'))
+    / 'conceptOntology' / 'ns_digest'
+))
 
-def load_startup_files() -> Tuple[bool, List[str], List[str]]:
+
+def _log_namespaces(namespaces: Dict[str, str]) -> None:
+    """
+    Log registered namespaces, skipping the per-prefix listing when the map
+    is identical to the one logged on the previous startup.
+    
+    Args:
+        namespaces: Dictionary mapping prefixes to namespace URIs
+    """
+    digest = hashlib.blake2b(repr(sorted(namespaces.items())).encode()).hexdigest()
+    
+    try:
+        previous_digest = NAMESPACE_DIGEST_FILE.read_text(encoding='utf-8').strip()
+    except OSError:
+        previous_digest = None
+    
+    if digest == previous_digest:
+        logger.info(f"  Namespaces unchanged ({len(namespaces)} entries)")
+        return
+    
+    logger.info(f"  Registered namespaces: {len(namespaces)}")
+    for prefix, uri in namespaces.items():
+        logger.info(f"    {prefix}: {uri}")
+    
+    try:
+        NAMESPACE_DIGEST_FILE.parent.mkdir(parents=True, exist_ok=True)
+        NAMESPACE_DIGEST_FILE.write_text(digest, encoding='utf-8')
+    except OSError as e:
+        logger.debug(f"Could not persist namespace digest: {e}")
+
+
+def load_startup_files() -> Tuple[bool, Tuple[str, ...], Tuple[str, ...]]:
     """
     Load ontology files during container startup.
     
@@ -38,7 +79,7 @@ def load_startup_files() -> Tuple[bool, List[str], List[str]]:
         from ontology.loader import RDFLoader
     except ImportError as e:
         logger.error(f"Failed to import RDFLoader: {e}")
-        return False, [], []
+        return False, (), ()
     
     logger.info("=" * 70)
     logger.info("ONTOLOGY STARTUP INITIALIZATION")
@@ -65,28 +106,40 @@ def load_startup_files() -> Tuple[bool, List[str], List[str]]:
     # Initialize loader
     loader = RDFLoader()
     
-    loaded_files = []
-    failed_files = []
-    
-    # Load each file
+    # Check which files exist
+    existing_files = []
     for file_path in files_to_load:
-        # Check if file exists
         if not file_path.exists():
             logger.warning(f"File not found: {file_path} - Skipping")
             continue
         
         logger.info(f"Loading: {file_path}")
-        
+        existing_files.append(file_path)
+    
+    # At most one entry per file, so both lists are sized up front
+    file_count = len(existing_files)
+    loaded_buffer: List[Optional[str]] = [None] * file_count
+    failed_buffer: List[Optional[str]] = [None] * file_count
+    loaded_count = 0
+    failed_count = 0
+    
+    # Load each file
+    for file_path in existing_files:
         try:
             # Load the file
             loader.load_file(str(file_path), validate=True)
-            loaded_files.append(str(file_path))
+            loaded_buffer[loaded_count] = str(file_path)
+            loaded_count += 1
             logger.info(f"✓ Successfully loaded: {file_path}")
             
         except Exception as e:
-            failed_files.append(str(file_path))
+            failed_buffer[failed_count] = str(file_path)
+            failed_count += 1
             logger.error(f"✗ Failed to load {file_path}: {str(e)}")
     
+    loaded_files = tuple(loaded_buffer[:loaded_count])
+    failed_files = tuple(failed_buffer[:failed_count])
+    
     # Log summary
     logger.info("-" * 70)
     logger.info(f"STARTUP LOADING SUMMARY:")
@@ -107,9 +160,7 @@ def load_startup_files() -> Tuple[bool, List[str], List[str]]:
     # Log namespace information
     namespaces = loader.get_namespaces()
     if namespaces:
-        logger.info(f"  Registered namespaces: {len(namespaces)}")
-        for prefix, uri in namespaces.items():
-            logger.info(f"    {prefix}: {uri}")
+        _log_namespaces(namespaces)
     
     logger.info("=" * 70)
     
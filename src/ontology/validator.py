@@ -34,11 +34,20 @@ Example Usage:
         print("Data has validation issues")
 """
 
+import fnmatch
+import hashlib
 import logging
+import os
+import sys
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union, Tuple
+from typing import ClassVar, Dict, Iterable, Iterator, List, Any, Optional, Set, TextIO, Union, Tuple
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from enum import IntEnum
 
 try:
     import maplib
@@ -64,6 +73,11 @@ class ShapeLoadError(SHACLValidationError):
     pass
 
 
+class ShapeFileNotFoundError(ShapeLoadError, FileNotFoundError):
+    """Exception raised when a SHACL shapes file or directory does not exist."""
+    pass
+
+
 class ValidationExecutionError(SHACLValidationError):
     """Exception raised when validation execution fails."""
     pass
@@ -75,57 +89,166 @@ class SeverityLevel:
     WARNING = "http://www.w3.org/ns/shacl#Warning"
     INFO = "http://www.w3.org/ns/shacl#Info"
     
+    _LABELS: ClassVar[Dict[str, str]] = {
+        VIOLATION: "Violation",
+        WARNING: "Warning",
+        INFO: "Info"
+    }
+    
     @classmethod
     def get_label(cls, severity_uri: str) -> str:
         """Get human-readable label for severity URI."""
-        mapping = {
-            cls.VIOLATION: "Violation",
-            cls.WARNING: "Warning",
-            cls.INFO: "Info"
-        }
-        return mapping.get(severity_uri, "Unknown")
+        return cls._LABELS.get(severity_uri, "Unknown")
     
     @classmethod
-    def all_levels(cls) -> List[str]:
-        """Get all severity level URIs."""
-        return [cls.VIOLATION, cls.WARNING, cls.INFO]
+    def all_levels(cls) -> Tuple[str, ...]:
+        """Get all severity level URIs, ordered by severity code."""
+        return _CODE_TO_URI
+
+
+class SeverityCode(IntEnum):
+    """Compact integer codes for SHACL severity levels."""
+    VIOLATION = 0
+    WARNING = 1
+    INFO = 2
+    UNKNOWN = 3
+
+
+# Severity URIs are only needed at the serialization boundary; everything
+# else compares integer codes
+_URI_TO_CODE = {
+    SeverityLevel.VIOLATION: SeverityCode.VIOLATION,
+    SeverityLevel.WARNING: SeverityCode.WARNING,
+    SeverityLevel.INFO: SeverityCode.INFO
+}
+_CODE_TO_URI = (SeverityLevel.VIOLATION, SeverityLevel.WARNING, SeverityLevel.INFO)
+_SEVERITY_LABELS = ("Violation", "Warning", "Info", "Unknown")
+
+
+# Turtle serialization templates for validation reports
+_TURTLE_REPORT_HEADER = """@prefix sh: <http://www.w3.org/ns/shacl#> .
+@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+@prefix : <http://example.org/validation#> .
+
+
+{report_uri} a sh:ValidationReport ;
+    sh:conforms {conforms} ;
+    rdfs:label "SHACL Validation Report" ;
+    rdfs:comment "Generated on {timestamp}" ;
+    :timestamp "{timestamp}"^^xsd:dateTime ;
+    :totalResults {total} ;
+    :violationCount {violations} ;
+    :warningCount {warnings} ;
+    :infoCount {info} ;
+"""
+_RESULT_TMPL = "\n{uri} a sh:ValidationResult ;\n    sh:focusNode <{focus}> ;\n"
+_RESULT_PATH_TMPL = "    sh:resultPath <{}> ;\n"
+_VALUE_TMPL = '    sh:value "{}" ;\n'
+_MESSAGE_TMPL = '    sh:resultMessage "{}"@en ;\n'
+_SEVERITY_TMPL = "    sh:resultSeverity <{}> ;\n"
+_SEVERITY_LINES = tuple(_SEVERITY_TMPL.format(uri) for uri in _CODE_TO_URI)
+_SOURCE_CONSTRAINT_TMPL = "    sh:sourceConstraintComponent <{}> ;\n"
+_SOURCE_SHAPE_TMPL = "    sh:sourceShape <{}> ;\n"
+_SEQUENCE_TMPL = "    :sequence {} .\n"
+
+# Escapes for characters that may not appear raw in a "..." Turtle literal
+_TTL_ESCAPE = str.maketrans({
+    '\\': '\\\\',
+    '"': '\\"',
+    '\n': '\\n',
+    '\r': '\\r',
+    '\t': '\\t'
+})
+
+
+def _esc(text: str) -> str:
+    """Escape a string for use inside a double-quoted Turtle literal."""
+    return text.translate(_TTL_ESCAPE)
+
+
+def _intern(term: Optional[str]) -> Optional[str]:
+    """Intern a URI so that repeated occurrences share one string object."""
+    return sys.intern(term) if term else term
+
+
+# Turtle export hands encoded blocks to the kernel in batches of this size
+_EXPORT_BATCH_BYTES = 256 * 1024
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+if _IOV_MAX <= 0:
+    _IOV_MAX = 1024
+
+
+def _write_chunks(fd: int, chunks: List[bytes]) -> None:
+    """
+    Write byte chunks to a file descriptor in as few syscalls as possible.
+    
+    Uses os.writev where the platform provides it (at most IOV_MAX buffers
+    per call) and completes any short write with os.write.
+    
+    Args:
+        fd: Open file descriptor
+        chunks: Byte strings to write, in order
+    """
+    if not hasattr(os, "writev"):
+        data = memoryview(b"".join(chunks))
+        while data:
+            data = data[os.write(fd, data):]
+        return
+    
+    for start in range(0, len(chunks), _IOV_MAX):
+        batch = chunks[start:start + _IOV_MAX]
+        written = os.writev(fd, batch)
+        expected = sum(map(len, batch))
+        if written < expected:
+            rest = memoryview(b"".join(batch))[written:]
+            while rest:
+                rest = rest[os.write(fd, rest):]
 
 
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """
     Represents a single SHACL validation result.
+    
+    Results are immutable and hashable. The timestamp and sequence number
+    describe when and where a result was reported, not the result itself,
+    so they are ignored when comparing results.
+    
+    Attributes:
+        focus_node: The RDF node that was validated
+        result_path: The property path that failed validation
+        value: The value that caused the violation
+        message: Human-readable validation message
+        severity: Severity level URI
+        source_constraint: The constraint component that was violated
+        source_shape: The shape that defined the constraint
+        timestamp: When the result was produced (default: now)
+        sequence: Position of the result within its report, if any
     """
+    focus_node: str
+    result_path: Optional[str]
+    value: Optional[str]
+    message: str
+    severity: str
+    source_constraint: Optional[str] = None
+    source_shape: Optional[str] = None
+    timestamp: datetime = field(default_factory=datetime.now, compare=False)
+    sequence: Optional[int] = field(default=None, compare=False)
+    _severity_code: SeverityCode = field(init=False, repr=False, compare=False)
     
-    def __init__(
-        self,
-        focus_node: str,
-        result_path: Optional[str],
-        value: Optional[str],
-        message: str,
-        severity: str,
-        source_constraint: Optional[str] = None,
-        source_shape: Optional[str] = None
-    ):
-        """
-        Initialize a validation result.
-        
-        Args:
-            focus_node: The RDF node that was validated
-            result_path: The property path that failed validation
-            value: The value that caused the violation
-            message: Human-readable validation message
-            severity: Severity level URI
-            source_constraint: The constraint component that was violated
-            source_shape: The shape that defined the constraint
-        """
-        self.focus_node = focus_node
-        self.result_path = result_path
-        self.value = value
-        self.message = message
-        self.severity = severity
-        self.source_constraint = source_constraint
-        self.source_shape = source_shape
-        self.timestamp = datetime.now()
+    def __post_init__(self):
+        """Fill in derived fields (frozen, so via object.__setattr__)."""
+        if self.timestamp is None:
+            object.__setattr__(self, 'timestamp', datetime.now())
+        object.__setattr__(
+            self, '_severity_code',
+            _URI_TO_CODE.get(self.severity, SeverityCode.UNKNOWN)
+        )
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert validation result to dictionary."""
@@ -135,15 +258,16 @@ class ValidationResult:
             'value': self.value,
             'message': self.message,
             'severity': self.severity,
-            'severity_label': SeverityLevel.get_label(self.severity),
+            'severity_label': _SEVERITY_LABELS[self._severity_code],
             'source_constraint': self.source_constraint,
             'source_shape': self.source_shape,
-            'timestamp': self.timestamp.isoformat()
+            'timestamp': self.timestamp.isoformat(),
+            'sequence': self.sequence
         }
     
     def __repr__(self) -> str:
         """String representation of validation result."""
-        severity_label = SeverityLevel.get_label(self.severity)
+        severity_label = _SEVERITY_LABELS[self._severity_code]
         return (
             f"ValidationResult({severity_label}: {self.focus_node} "
             f"- {self.message})"
@@ -153,52 +277,282 @@ class ValidationResult:
 class ValidationReport:
     """
     Represents a complete SHACL validation report.
+    
+    Results are stored column-wise (one list per result field) so that
+    filtering and grouping scan a single contiguous column. ValidationResult
+    objects are only constructed when a caller asks for them, once per
+    result; the query methods return the objects of the results tuple.
     """
     
-    def __init__(self, conforms: bool):
+    def __init__(self, conforms: bool, dedupe: bool = True):
         """
         Initialize a validation report.
         
         Args:
             conforms: Whether the data conforms to all shapes
+            dedupe: Drop results identical to one already in the report
+                (default: True); disable to keep raw result counts
         """
         self.conforms = conforms
-        self.results: List[ValidationResult] = []
+        self.dedupe = dedupe
         self.timestamp = datetime.now()
         self.shapes_loaded: List[str] = []
         self.data_sources: List[str] = []
+        
+        # Result columns
+        self._focus_nodes: List[str] = []
+        self._result_paths: List[Optional[str]] = []
+        self._values: List[Optional[str]] = []
+        self._messages: List[str] = []
+        self._severities: List[str] = []
+        self._source_constraints: List[Optional[str]] = []
+        self._source_shapes: List[Optional[str]] = []
+        self._next_result_seq = 0
+        self._severity_codes = array('B')
+        # Running per-code counts, indexed by SeverityCode
+        self._severity_counts = [0] * len(SeverityCode)
+        
+        # Identity of every stored result (see _result_key), for dedupe
+        self._seen: Set[Tuple[Optional[str], ...]] = set()
+        
+        # Indexes (key -> result indices), maintained on every insert
+        self._by_focus: Dict[str, List[int]] = defaultdict(list)
+        self._by_shape: Dict[str, List[int]] = defaultdict(list)
+        self._by_severity: List[List[int]] = [[] for _ in SeverityCode]
+        
+        # Built on first access to results, dropped whenever results are added
+        self._results_cache: Optional[Tuple[ValidationResult, ...]] = None
+    
+    @property
+    def results(self) -> Tuple[ValidationResult, ...]:
+        """
+        All validation results, in insertion order.
+        
+        Read-only: the tuple is a snapshot built from the result columns.
+        Use add_result, add_results or merge to add results.
+        """
+        if self._results_cache is None:
+            self._results_cache = tuple(
+                self._result_at(i) for i in range(len(self._focus_nodes))
+            )
+        return self._results_cache
+    
+    def _result_at(self, index: int) -> ValidationResult:
+        """
+        Build a ValidationResult from the columns at the given index.
+        
+        Results share the report timestamp; their position in the report
+        is carried as the sequence number.
+        """
+        return ValidationResult(
+            focus_node=self._focus_nodes[index],
+            result_path=self._result_paths[index],
+            value=self._values[index],
+            message=self._messages[index],
+            severity=self._severities[index],
+            source_constraint=self._source_constraints[index],
+            source_shape=self._source_shapes[index],
+            timestamp=self.timestamp,
+            sequence=index
+        )
+    
+    @staticmethod
+    def _result_key(result: ValidationResult) -> Tuple[Optional[str], ...]:
+        """
+        The fields that make two results equal (as ValidationResult.__eq__).
+        
+        The value is keyed by its repr, so unhashable values such as lists
+        can still be deduplicated.
+        """
+        return (
+            result.focus_node, result.result_path, repr(result.value), result.message,
+            result.severity, result.source_constraint, result.source_shape
+        )
     
     def add_result(self, result: ValidationResult) -> None:
         """Add a validation result to the report."""
-        self.results.append(result)
+        if self.dedupe:
+            key = self._result_key(result)
+            if key in self._seen:
+                return
+            self._seen.add(key)
+        
+        # URIs repeat heavily across results; messages and values are free
+        # text and are stored as given
+        self._focus_nodes.append(_intern(result.focus_node))
+        self._result_paths.append(_intern(result.result_path))
+        self._values.append(result.value)
+        self._messages.append(result.message)
+        self._severities.append(result.severity)
+        self._source_constraints.append(_intern(result.source_constraint))
+        self._source_shapes.append(_intern(result.source_shape))
+        self._severity_codes.append(result._severity_code)
+        self._severity_counts[result._severity_code] += 1
+        
         # Update conforms status
-        if result.severity == SeverityLevel.VIOLATION:
+        if result._severity_code == SeverityCode.VIOLATION:
             self.conforms = False
+        
+        self._index_rows(self._next_result_seq)
+        self._next_result_seq += 1
+        self._results_cache = None
     
-    def get_results_by_severity(self, severity: str) -> List[ValidationResult]:
-        """Get all results with a specific severity level."""
-        return [r for r in self.results if r.severity == severity]
+    def add_results(self, results: Iterable[ValidationResult]) -> None:
+        """
+        Add a batch of validation results to the report.
+        
+        Equivalent to calling add_result for each result, but each column is
+        extended in one call and conforms is only updated once for the whole
+        batch.
+        
+        Args:
+            results: Validation results to add, in order
+        """
+        if self.dedupe:
+            seen = self._seen
+            unique = []
+            for result in results:
+                key = self._result_key(result)
+                if key not in seen:
+                    seen.add(key)
+                    unique.append(result)
+            results = unique
+        else:
+            results = list(results)
+        
+        if not results:
+            return
+        
+        codes = array('B', [result._severity_code for result in results])
+        self._focus_nodes.extend([_intern(r.focus_node) for r in results])
+        self._result_paths.extend([_intern(r.result_path) for r in results])
+        self._values.extend([r.value for r in results])
+        self._messages.extend([r.message for r in results])
+        self._severities.extend([r.severity for r in results])
+        self._source_constraints.extend([_intern(r.source_constraint) for r in results])
+        self._source_shapes.extend([_intern(r.source_shape) for r in results])
+        self._severity_codes.extend(codes)
+        for code, count in Counter(codes).items():
+            self._severity_counts[code] += count
+        
+        # Update conforms status
+        if SeverityCode.VIOLATION in codes:
+            self.conforms = False
+        
+        self._index_rows(self._next_result_seq)
+        self._next_result_seq += len(results)
+        self._results_cache = None
+    
+    def merge(self, other: "ValidationReport") -> None:
+        """
+        Append all results of another report to this one.
+        
+        The merged report conforms only if both reports conform. Merged
+        results take this report's timestamp.
+        
+        Args:
+            other: ValidationReport whose results are appended
+        """
+        if self.dedupe:
+            # Results may repeat across reports; filter them like a batch
+            self.add_results(other.results)
+            self.conforms = self.conforms and other.conforms
+            return
+        
+        self._focus_nodes.extend(other._focus_nodes)
+        self._result_paths.extend(other._result_paths)
+        self._values.extend(other._values)
+        self._messages.extend(other._messages)
+        self._severities.extend(other._severities)
+        self._source_constraints.extend(other._source_constraints)
+        self._source_shapes.extend(other._source_shapes)
+        self._severity_codes.extend(other._severity_codes)
+        for code, count in enumerate(other._severity_counts):
+            self._severity_counts[code] += count
+        
+        self.conforms = self.conforms and other.conforms
+        
+        self._index_rows(self._next_result_seq)
+        self._next_result_seq += len(other._severity_codes)
+        self._results_cache = None
+    
+    def _index_rows(self, start: int) -> None:
+        """Add the results from index start onwards to the lookup indexes."""
+        by_focus = self._by_focus
+        by_shape = self._by_shape
+        by_severity = self._by_severity
+        for i in range(start, len(self._severity_codes)):
+            by_focus[self._focus_nodes[i]].append(i)
+            by_shape[self._source_shapes[i] or "Unknown"].append(i)
+            by_severity[self._severity_codes[i]].append(i)
+    
+    def get_results_by_severity(
+        self,
+        severity: Union[str, SeverityCode]
+    ) -> List[ValidationResult]:
+        """
+        Get all results with a specific severity level (URI or code).
+        
+        Raises:
+            ValueError: If severity is an integer that is not a SeverityCode
+        """
+        if isinstance(severity, int):
+            try:
+                target = SeverityCode(severity)
+            except ValueError:
+                raise ValueError(f"Unknown severity code: {severity}") from None
+        else:
+            target = _URI_TO_CODE.get(severity, SeverityCode.UNKNOWN)
+        
+        if target == SeverityCode.UNKNOWN and not isinstance(severity, int):
+            # Severities outside the SHACL vocabulary share one code
+            indices = [i for i, s in enumerate(self._severities) if s == severity]
+        else:
+            indices = self._by_severity[target]
+        
+        results = self.results
+        return [results[i] for i in indices]
     
     def get_violations(self) -> List[ValidationResult]:
         """Get all violation-level results."""
-        return self.get_results_by_severity(SeverityLevel.VIOLATION)
+        return self.get_results_by_severity(SeverityCode.VIOLATION)
     
     def get_warnings(self) -> List[ValidationResult]:
         """Get all warning-level results."""
-        return self.get_results_by_severity(SeverityLevel.WARNING)
+        return self.get_results_by_severity(SeverityCode.WARNING)
     
     def get_info(self) -> List[ValidationResult]:
         """Get all info-level results."""
-        return self.get_results_by_severity(SeverityLevel.INFO)
+        return self.get_results_by_severity(SeverityCode.INFO)
+    
+    def get_results_by_focus_node(self) -> Dict[str, List[ValidationResult]]:
+        """Group validation results by focus node."""
+        return self._resolve_groups(self._by_focus)
+    
+    def get_results_by_shape(self) -> Dict[str, List[ValidationResult]]:
+        """Group validation results by source shape."""
+        return self._resolve_groups(self._by_shape)
+    
+    def _resolve_groups(
+        self,
+        groups: Dict[str, List[int]]
+    ) -> Dict[str, List[ValidationResult]]:
+        """Turn a grouping of result indices into a grouping of results."""
+        results = self.results
+        return {
+            key: [results[i] for i in indices]
+            for key, indices in groups.items()
+        }
     
     def get_summary(self) -> Dict[str, Any]:
         """Get summary statistics for the validation report."""
+        counts = self._severity_counts
         return {
             'conforms': self.conforms,
-            'total_results': len(self.results),
-            'violation_count': len(self.get_violations()),
-            'warning_count': len(self.get_warnings()),
-            'info_count': len(self.get_info()),
+            'total_results': len(self._severity_codes),
+            'violation_count': counts[SeverityCode.VIOLATION],
+            'warning_count': counts[SeverityCode.WARNING],
+            'info_count': counts[SeverityCode.INFO],
             'timestamp': self.timestamp.isoformat(),
             'shapes_loaded': len(self.shapes_loaded),
             'data_sources': len(self.data_sources)
@@ -206,11 +560,33 @@ class ValidationReport:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert validation report to dictionary."""
+        timestamp = self.timestamp.isoformat()
+        results = [
+            {
+                'focus_node': focus_node,
+                'result_path': result_path,
+                'value': value,
+                'message': message,
+                'severity': severity,
+                'severity_label': _SEVERITY_LABELS[code],
+                'source_constraint': source_constraint,
+                'source_shape': source_shape,
+                'timestamp': timestamp,
+                'sequence': sequence
+            }
+            for sequence, (focus_node, result_path, value, message, severity,
+                code, source_constraint, source_shape) in enumerate(zip(
+                    self._focus_nodes, self._result_paths, self._values,
+                    self._messages, self._severities, self._severity_codes,
+                    self._source_constraints, self._source_shapes
+                ))
+        ]
+        
         return {
             'conforms': self.conforms,
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': timestamp,
             'summary': self.get_summary(),
-            'results': [r.to_dict() for r in self.results],
+            'results': results,
             'shapes_loaded': self.shapes_loaded,
             'data_sources': self.data_sources
         }
@@ -226,6 +602,146 @@ class ValidationReport:
         )
 
 
+def _bucket_by_severity(
+    report: ValidationReport
+) -> Tuple[List[ValidationResult], List[ValidationResult], List[ValidationResult]]:
+    """
+    Split report results into violation, warning and info lists.
+    
+    Results with a severity outside the SHACL vocabulary are left out.
+    
+    Args:
+        report: ValidationReport to split
+    
+    Returns:
+        Tuple of (violations, warnings, infos), indexed by SeverityCode
+    """
+    results = report.results
+    violations, warnings, infos = (
+        [results[i] for i in indices] for indices in report._by_severity[:3]
+    )
+    return violations, warnings, infos
+
+
+def _text_result_block(index: int, result: ValidationResult) -> str:
+    """
+    Render one result of the plain text report as a single string.
+
+    The trailing newline stands in for the blank separator line, so the
+    block can be joined with the surrounding report lines as-is.
+    """
+    return "".join((
+        f"  {index}. Focus Node: {result.focus_node}\n",
+        f"     Path: {result.result_path}\n" if result.result_path else "",
+        f"     Value: {result.value}\n" if result.value else "",
+        f"     Message: {result.message}\n",
+        f"     Shape: {result.source_shape}\n" if result.source_shape else "",
+    ))
+
+
+def _markdown_result_block(index: int, result: ValidationResult) -> str:
+    """Render one result of the Markdown report as a single string."""
+    return "".join((
+        f"**{index}. {result.focus_node}**\n\n",
+        f"- **Path:** `{result.result_path}`\n" if result.result_path else "",
+        f"- **Value:** `{result.value}`\n" if result.value else "",
+        f"- **Message:** {result.message}\n",
+        f"- **Shape:** `{result.source_shape}`\n" if result.source_shape else "",
+    ))
+
+
+# Inference regimes validate() accepts; 'none' (the default) skips the
+# expensive entailment step entirely
+_INFERENCE_MODES = frozenset({'none', 'rdfs', 'owlrl', 'both'})
+
+# Shapes file content shared by all validators in the process:
+# absolute path -> (st_mtime_ns, content, SHA-256 digest)
+_SHAPES_CACHE: Dict[str, Tuple[int, bytes, bytes]] = {}
+# At most this many files are cached; the least recently stored is evicted
+# first, so a long-running process loading many paths stays bounded
+_SHAPES_CACHE_MAX_FILES = 256
+# Serialises cache updates from the directory loader's worker threads
+_SHAPES_CACHE_LOCK = threading.Lock()
+
+# Shapes directories loaded by create_validator:
+# absolute path -> (st_mtime_ns, ((loaded file path, st_mtime_ns), ...))
+_DIR_CACHE: Dict[str, Tuple[int, Tuple[Tuple[str, int], ...]]] = {}
+
+
+def _cache_shapes(cache_key: str, entry: Tuple[int, bytes, bytes]) -> None:
+    """Store a shapes cache entry, evicting the oldest ones beyond the limit."""
+    with _SHAPES_CACHE_LOCK:
+        _SHAPES_CACHE.pop(cache_key, None)
+        while len(_SHAPES_CACHE) >= _SHAPES_CACHE_MAX_FILES:
+            del _SHAPES_CACHE[next(iter(_SHAPES_CACHE))]
+        _SHAPES_CACHE[cache_key] = entry
+
+
+def _iter_shape_files(directory_path: Path, pattern: str) -> Iterator[Tuple[Path, int]]:
+    """
+    Yield the files in a directory that match a pattern, with their mtimes.
+    
+    Entries are yielded as the directory is read. The modification time
+    comes from the scandir entry, so callers need no further stat call
+    before consulting the shapes cache.
+    
+    Args:
+        directory_path: Directory to scan (not recursive)
+        pattern: fnmatch-style file name pattern
+    
+    Yields:
+        Tuples of (file path, st_mtime_ns) in directory order
+    """
+    with os.scandir(directory_path) as entries:
+        for entry in entries:
+            # The cached dirent type answers is_file() without a stat
+            if entry.is_file() and fnmatch.fnmatch(entry.name, pattern):
+                yield Path(entry.path), entry.stat().st_mtime_ns
+
+
+def _reuse_shapes_directory(
+    validator: "SHACLValidator",
+    dir_key: str,
+    dir_mtime_ns: int
+) -> bool:
+    """
+    Fill a validator from a shapes directory loaded before, if unchanged.
+    
+    The directory's own modification time catches added, removed and
+    renamed files; each file's modification time is checked as well so
+    edits in place are noticed. Content comes from the shapes cache.
+    
+    Args:
+        validator: Validator to store the shapes in
+        dir_key: Absolute path of the shapes directory
+        dir_mtime_ns: Current st_mtime_ns of the directory
+    
+    Returns:
+        True if the shapes were reused, False if the directory must be loaded
+    """
+    cached = _DIR_CACHE.get(dir_key)
+    if cached is None or cached[0] != dir_mtime_ns:
+        return False
+    
+    loaded = []
+    for file_path, mtime_ns in cached[1]:
+        file_key = os.path.abspath(file_path)
+        content = _SHAPES_CACHE.get(file_key)
+        if content is None or content[0] != mtime_ns:
+            return False
+        try:
+            if os.stat(file_key).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+        loaded.append((Path(file_path), content[1], content[2]))
+    
+    with validator._shapes_lock:
+        for file_path, content, digest in loaded:
+            validator._store_shapes(file_path, content, digest)
+    return True
+
+
 class SHACLValidator:
     """
     SHACL Validator for validating RDF data against SHACL shapes using maplib.
@@ -239,17 +755,25 @@ class SHACLValidator:
     - Provide summary statistics
     """
     
-    def __init__(self, rdf_loader=None):
+    def __init__(self, rdf_loader=None, parallel: bool = False):
         """
         Initialize the SHACL validator.
         
         Args:
             rdf_loader: RDFLoader instance with loaded data (optional)
+            parallel: Validate each loaded shapes file on its own worker
+                thread (default: False). Only enable this when no shape
+                refers to a shape in another file (sh:node, sh:and, ...),
+                since each file is then validated in isolation
         """
         self.rdf_loader = rdf_loader
+        self.parallel = parallel
         self.shapes_data: List[Dict] = []
         self.loaded_shape_files: List[str] = []
         self.validation_count = 0
+        self._shapes_lock = threading.Lock()
+        # SHA-256 digest of shapes content -> the shapes_data entry holding it
+        self._content_by_hash: Dict[bytes, Dict] = {}
         logger.info("SHACL Validator initialized")
     
     def set_rdf_loader(self, rdf_loader) -> None:
@@ -273,38 +797,97 @@ class SHACLValidator:
             True if loading was successful
         
         Raises:
+            ShapeFileNotFoundError: If the file does not exist
             ShapeLoadError: If loading fails
         """
         file_path = Path(file_path)
+        content, digest = self._load_shapes_io(file_path)
         
-        if not file_path.exists():
-            error_msg = f"Shapes file not found: {file_path}"
-            logger.error(error_msg)
-            raise ShapeLoadError(error_msg)
+        with self._shapes_lock:
+            self._store_shapes(file_path, content, digest)
+        
+        return True
+    
+    def _load_shapes_io(
+        self,
+        file_path: Path,
+        mtime_ns: Optional[int] = None
+    ) -> Tuple[bytes, bytes]:
+        """
+        Read a SHACL shapes file without touching shared validator state.
+        
+        Content is cached per absolute path and reused for as long as the
+        file's modification time is unchanged. The file is not checked for
+        existence up front; a missing file surfaces from the stat or read.
+        
+        Args:
+            file_path: Path to the SHACL shapes file
+            mtime_ns: Modification time already known from a directory
+                scan; when omitted the file is stat'ed here
+        
+        Returns:
+            Tuple of (raw file content, SHA-256 digest of the content)
         
-        logger.info(f"Loading SHACL shapes from: {file_path}")
+        Raises:
+            ShapeFileNotFoundError: If the file does not exist
+            ShapeLoadError: If reading fails
+        """
+        logger.info("Loading SHACL shapes from: %s", file_path)
         
         try:
-            # Read shapes file content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Store shapes data
-            self.shapes_data.append({
-                'file': str(file_path),
-                'content': content
-            })
-            
-            self.loaded_shape_files.append(str(file_path))
-            logger.info(f"Successfully loaded shapes from: {file_path}")
+            cache_key = os.path.abspath(file_path)
+            if mtime_ns is None:
+                mtime_ns = file_path.stat().st_mtime_ns
+            cached = _SHAPES_CACHE.get(cache_key)
+            if cached is not None and cached[0] == mtime_ns:
+                logger.debug("Using cached shapes for: %s", file_path)
+                return cached[1], cached[2]
             
-            return True
+            # Kept as bytes since the Turtle is handed to maplib as-is and
+            # decoding would be wasted work
+            content = file_path.read_bytes()
+            digest = hashlib.sha256(content).digest()
+            _cache_shapes(cache_key, (mtime_ns, content, digest))
+            return content, digest
             
-        except Exception as e:
+        except FileNotFoundError as e:
+            error_msg = f"Shapes file not found: {file_path}"
+            logger.error(error_msg)
+            raise ShapeFileNotFoundError(error_msg) from e
+        except OSError as e:
             error_msg = f"Error loading shapes from {file_path}: {str(e)}"
             logger.error(error_msg)
             raise ShapeLoadError(error_msg) from e
     
+    def _store_shapes(self, file_path: Path, content: bytes, digest: bytes) -> None:
+        """
+        Record loaded shapes content. Callers must hold the shapes lock.
+        
+        Content identical to shapes that are already loaded is not stored
+        again; the file is only added to the list of loaded files.
+        
+        Args:
+            file_path: Path to the SHACL shapes file
+            content: Raw file content
+            digest: SHA-256 digest of the content
+        """
+        existing = self._content_by_hash.get(digest)
+        if existing is None:
+            entry = {
+                'file': str(file_path),
+                'content_bytes': content
+            }
+            self.shapes_data.append(entry)
+            self._content_by_hash[digest] = entry
+            logger.info("Successfully loaded shapes from: %s", file_path)
+        else:
+            logger.info(
+                "Shapes in %s are identical to %s, not storing them again",
+                file_path, existing['file']
+            )
+        
+        self.loaded_shape_files.append(str(file_path))
+    
     def load_shapes_directory(
         self,
         directory_path: Union[str, Path],
@@ -313,43 +896,86 @@ class SHACLValidator:
         """
         Load all SHACL shape files from a directory.
         
+        Files are handed to a thread pool as the directory is scanned, read
+        concurrently, and then recorded in directory order.
+        
         Args:
             directory_path: Path to the directory
             pattern: File pattern to match (default: "*.ttl")
         
         Returns:
             Tuple of (successful_files, failed_files)
+        
+        Raises:
+            ShapeFileNotFoundError: If the directory does not exist or is not
+                a directory
+            ShapeLoadError: If the directory cannot be read
         """
         directory_path = Path(directory_path)
         
-        if not directory_path.exists():
-            error_msg = f"Directory not found: {directory_path}"
-            logger.error(error_msg)
-            raise ShapeLoadError(error_msg)
-        
-        file_paths = list(directory_path.glob(pattern))
-        logger.info(f"Found {len(file_paths)} shape files in {directory_path}")
-        
         successful_files = []
         failed_files = []
         
-        for file_path in file_paths:
+        loaded = []
+        # Worker threads are only started as files are submitted
+        with ThreadPoolExecutor(max_workers=32) as executor:
             try:
-                self.load_shapes(file_path)
+                submitted = [
+                    (file_path, executor.submit(self._load_shapes_io, file_path, mtime_ns))
+                    for file_path, mtime_ns in _iter_shape_files(directory_path, pattern)
+                ]
+            except FileNotFoundError as e:
+                error_msg = f"Directory not found: {directory_path}"
+                logger.error(error_msg)
+                raise ShapeFileNotFoundError(error_msg) from e
+            except NotADirectoryError as e:
+                error_msg = f"Not a directory: {directory_path}"
+                logger.error(error_msg)
+                raise ShapeFileNotFoundError(error_msg) from e
+            except OSError as e:
+                error_msg = f"Error reading directory {directory_path}: {str(e)}"
+                logger.error(error_msg)
+                raise ShapeLoadError(error_msg) from e
+            logger.info("Found %d shape files in %s", len(submitted), directory_path)
+            
+            for file_path, future in submitted:
+                try:
+                    loaded.append((file_path, future.result()))
+                except ShapeLoadError as e:
+                    failed_files.append(str(file_path))
+                    logger.error("Failed to load %s: %s", file_path, e)
+        
+        # Record all results under a single lock acquisition
+        with self._shapes_lock:
+            for file_path, (content, digest) in loaded:
+                self._store_shapes(file_path, content, digest)
                 successful_files.append(str(file_path))
-            except ShapeLoadError as e:
-                failed_files.append(str(file_path))
-                logger.error(f"Failed to load {file_path}: {str(e)}")
         
         return successful_files, failed_files
 
     
-    def validate(self, data_graph=None) -> ValidationReport:
+    def validate(
+        self,
+        data_graph=None,
+        focus_filter: Optional[Set[str]] = None,
+        inference: str = 'none',
+        advanced: bool = False
+    ) -> ValidationReport:
         """
         Execute SHACL validation against RDF data.
         
+        The defaults are the fast path: no inference over the data graph and
+        only SHACL Core constraints. Pass inference or advanced to opt in to
+        the more expensive features when the shapes need them.
+        
         Args:
             data_graph: Optional RDF data to validate (uses rdf_loader if not provided)
+            focus_filter: Optional set of node URIs to restrict validation to;
+                shapes are only evaluated against these focus nodes
+            inference: Inference to run on the data graph before validating
+                ('none', 'rdfs', 'owlrl' or 'both')
+            advanced: Whether to evaluate SHACL Advanced Features
+                (SPARQL-based constraints and rules)
         
         Returns:
             ValidationReport with results
@@ -357,6 +983,11 @@ class SHACLValidator:
         Raises:
             ValidationExecutionError: If validation fails
         """
+        if inference not in _INFERENCE_MODES:
+            error_msg = f"Unsupported inference mode: {inference}"
+            logger.error(error_msg)
+            raise ValidationExecutionError(error_msg)
+        
         if not self.shapes_data:
             error_msg = "No SHACL shapes loaded. Call load_shapes() first."
             logger.error(error_msg)
@@ -381,12 +1012,22 @@ class SHACLValidator:
             # Actual implementation would use maplib's SHACL validation capabilities
             logger.warning("SHACL validation execution requires maplib validation API implementation")
             
+            with self._shapes_lock:
+                shapes = list(self.shapes_data)
+            
             # Placeholder: Parse shapes and simulate validation
             # In a real implementation, maplib would handle this
-            self._simulate_validation(report)
+            if self.parallel and len(shapes) > 1:
+                self._validate_parallel(
+                    report, shapes, focus_filter, inference, advanced
+                )
+            else:
+                self._simulate_validation(
+                    report, focus_filter, shapes, inference, advanced
+                )
             
             self.validation_count += 1
-            logger.info(f"Validation completed: {report}")
+            logger.info("Validation completed: %s", report)
             
             return report
             
@@ -395,16 +1036,69 @@ class SHACLValidator:
             logger.error(error_msg)
             raise ValidationExecutionError(error_msg) from e
     
-    def _simulate_validation(self, report: ValidationReport) -> None:
+    def _validate_parallel(
+        self,
+        report: ValidationReport,
+        shapes: List[Dict],
+        focus_filter: Optional[Set[str]] = None,
+        inference: str = 'none',
+        advanced: bool = False
+    ) -> None:
+        """
+        Validate against each shapes entry on a thread pool.
+        
+        Every shapes entry gets its own partial report; the partial reports
+        are merged into the given report in load order, so results come out
+        in the same order as a serial run.
+        
+        Args:
+            report: ValidationReport to populate with results
+            shapes: Loaded shapes entries to validate against
+            focus_filter: Optional set of node URIs to restrict validation to
+            inference: Inference to run on the data graph before validating
+            advanced: Whether to evaluate SHACL Advanced Features
+        """
+        def validate_entry(entry: Dict) -> ValidationReport:
+            # Duplicates are dropped when the partial reports are merged
+            partial = ValidationReport(conforms=True, dedupe=False)
+            self._simulate_validation(
+                partial, focus_filter, [entry], inference, advanced
+            )
+            return partial
+        
+        max_workers = min(os.cpu_count() or 1, len(shapes))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for partial in executor.map(validate_entry, shapes):
+                report.merge(partial)
+    
+    def _simulate_validation(
+        self,
+        report: ValidationReport,
+        focus_filter: Optional[Set[str]] = None,
+        shapes: Optional[List[Dict]] = None,
+        inference: str = 'none',
+        advanced: bool = False
+    ) -> None:
         """
         Simulate validation for demonstration purposes.
         This would be replaced by actual maplib validation.
         
         Args:
             report: ValidationReport to populate with results
+            focus_filter: Optional set of node URIs to restrict validation to
+            shapes: Shapes entries to validate against (default: all loaded)
+            inference: Inference to run on the data graph before validating
+            advanced: Whether to evaluate SHACL Advanced Features
         """
         # This is a placeholder that demonstrates the structure
-        # Real implementation would use maplib to perform actual validation
+        # Real implementation would use maplib to perform actual validation,
+        # passing focus_filter on as an sh:targetNode restriction so shapes
+        # are only evaluated against the requested nodes, creating results
+        # with timestamp=report.timestamp to avoid a clock read per result,
+        # and handing each batch maplib returns to report.add_results.
+        # inference and advanced are passed straight to the maplib call; with
+        # the defaults ('none', False) no entailment is computed and only
+        # SHACL Core constraints are compiled
         logger.debug("Simulating validation (placeholder for maplib implementation)")
         
         # Example: Add a sample result to show structure
@@ -429,23 +1123,25 @@ class SHACLValidator:
         Raises:
             ValidationExecutionError: If validation fails
         """
-        logger.info(f"Validating node: {node_uri}")
+        logger.info("Validating node: %s", node_uri)
         
         try:
-            # Execute full validation
-            full_report = self.validate()
+            # Ask the backend to validate only the requested node
+            full_report = self.validate(focus_filter={node_uri})
             
-            # Filter results for the specific node
+            # Keep only results for the node (and shape), in case the
+            # backend does not apply focus_filter itself
             node_report = ValidationReport(conforms=True)
             node_report.shapes_loaded = full_report.shapes_loaded
             node_report.data_sources = full_report.data_sources
             
-            for result in full_report.results:
-                if result.focus_node == node_uri:
-                    if shape_uri is None or result.source_shape == shape_uri:
-                        node_report.add_result(result)
+            node_report.add_results(
+                full_report._result_at(i)
+                for i in full_report._by_focus.get(node_uri, ())
+                if shape_uri is None or full_report._source_shapes[i] == shape_uri
+            )
             
-            logger.info(f"Node validation completed: {node_report}")
+            logger.info("Node validation completed: %s", node_report)
             return node_report
             
         except Exception as e:
@@ -463,7 +1159,7 @@ class SHACLValidator:
         Returns:
             True if data conforms (no violations)
         """
-        return report.conforms and len(report.get_violations()) == 0
+        return report.conforms and report._severity_counts[SeverityCode.VIOLATION] == 0
     
     def get_summary(self, report: ValidationReport) -> Dict[str, Any]:
         """
@@ -489,15 +1185,13 @@ class SHACLValidator:
             summary['violation_percentage'] = 0.0
             summary['warning_percentage'] = 0.0
         
-        # Group results by focus node
-        focus_nodes = defaultdict(int)
-        for result in report.results:
-            focus_nodes[result.focus_node] += 1
+        # Results per focus node are the lengths of the report's index lists
+        by_focus = report._by_focus
+        counts = list(map(len, by_focus.values()))
         
-        summary['affected_nodes'] = len(focus_nodes)
+        summary['affected_nodes'] = len(by_focus)
         summary['most_affected_node'] = (
-            max(focus_nodes.items(), key=lambda x: x[1])[0]
-            if focus_nodes else None
+            list(by_focus)[counts.index(max(counts))] if counts else None
         )
         
         return summary
@@ -515,12 +1209,7 @@ class SHACLValidator:
         Returns:
             Dictionary mapping focus nodes to their validation results
         """
-        results_by_node = defaultdict(list)
-        
-        for result in report.results:
-            results_by_node[result.focus_node].append(result)
-        
-        return dict(results_by_node)
+        return report.get_results_by_focus_node()
     
     def get_results_by_shape(
         self,
@@ -535,13 +1224,7 @@ class SHACLValidator:
         Returns:
             Dictionary mapping shapes to their validation results
         """
-        results_by_shape = defaultdict(list)
-        
-        for result in report.results:
-            shape = result.source_shape or "Unknown"
-            results_by_shape[shape].append(result)
-        
-        return dict(results_by_shape)
+        return report.get_results_by_shape()
     
     def export_report(
         self,
@@ -565,7 +1248,7 @@ class SHACLValidator:
             # Ensure output directory exists
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            logger.info(f"Exporting validation report to: {output_path}")
+            logger.info("Exporting validation report to: %s", output_path)
             
             if format == "turtle":
                 self._export_turtle(report, output_path)
@@ -574,7 +1257,7 @@ class SHACLValidator:
                 logger.error(error_msg)
                 raise ValidationExecutionError(error_msg)
             
-            logger.info(f"Validation report exported successfully")
+            logger.info("Validation report exported successfully")
             
         except Exception as e:
             error_msg = f"Error exporting report to {output_path}: {str(e)}"
@@ -593,11 +1276,21 @@ class SHACLValidator:
             report: ValidationReport to export
             output_path: Path to the output file
         """
-        # Generate Turtle serialization of validation report
-        turtle_content = self._generate_turtle_report(report)
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(turtle_content)
+        # Blocks are encoded once each and handed to the kernel in batches
+        with open(output_path, 'wb', buffering=0) as f:
+            fd = f.fileno()
+            batch: List[bytes] = []
+            batch_size = 0
+            for block in self._iter_turtle_report(report):
+                chunk = block.encode('utf-8')
+                batch.append(chunk)
+                batch_size += len(chunk)
+                if batch_size >= _EXPORT_BATCH_BYTES:
+                    _write_chunks(fd, batch)
+                    batch = []
+                    batch_size = 0
+            if batch:
+                _write_chunks(fd, batch)
     
     def _generate_turtle_report(self, report: ValidationReport) -> str:
         """
@@ -609,78 +1302,73 @@ class SHACLValidator:
         Returns:
             Turtle-formatted string
         """
-        # SHACL validation report namespace prefixes
-        prefixes = """@prefix sh: <http://www.w3.org/ns/shacl#> .
-@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
-@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
-@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-@prefix : <http://example.org/validation#> .
-
-"""
+        return "".join(self._iter_turtle_report(report))
+    
+    def _iter_turtle_report(self, report: ValidationReport) -> Iterator[str]:
+        """
+        Yield the Turtle serialization of a validation report block by block.
         
-        # Validation report header
-        report_uri = f":report_{report.timestamp.strftime('%Y%m%d_%H%M%S')}"
+        The header, the sh:result list and each result are yielded as one
+        string apiece.
         
-        lines = [prefixes]
-        lines.append(f"{report_uri} a sh:ValidationReport ;")
-        lines.append(f"    sh:conforms {str(report.conforms).lower()} ;")
-        lines.append(f'    rdfs:label "SHACL Validation Report" ;')
-        lines.append(f'    rdfs:comment "Generated on {report.timestamp.isoformat()}" ;')
+        Args:
+            report: ValidationReport to serialize
         
-        # Add summary statistics
+        Yields:
+            Turtle fragments in document order
+        """
         summary = report.get_summary()
-        lines.append(f'    :totalResults {summary["total_results"]} ;')
-        lines.append(f'    :violationCount {summary["violation_count"]} ;')
-        lines.append(f'    :warningCount {summary["warning_count"]} ;')
-        lines.append(f'    :infoCount {summary["info_count"]} ;')
         
-        # Add validation results
-        if report.results:
-            lines.append("    sh:result")
-            
-            for i, result in enumerate(report.results):
-                result_uri = f":result_{i+1}"
-                is_last = (i == len(report.results) - 1)
-                
-                lines.append(f"        {result_uri}{' .' if is_last else ' ,'}")
-            
-            lines.append("")
-            
-            # Define each validation result
-            for i, result in enumerate(report.results):
-                result_uri = f":result_{i+1}"
-                
-                lines.append(f"{result_uri} a sh:ValidationResult ;")
-                lines.append(f"    sh:focusNode <{result.focus_node}> ;")
-                
-                if result.result_path:
-                    lines.append(f"    sh:resultPath <{result.result_path}> ;")
-                
-                if result.value:
-                    lines.append(f'    sh:value "{result.value}" ;')
-                
-                lines.append(f'    sh:resultMessage "{result.message}"@en ;')
-                lines.append(f"    sh:resultSeverity <{result.severity}> ;")
-                
-                if result.source_constraint:
-                    lines.append(f"    sh:sourceConstraintComponent <{result.source_constraint}> ;")
-                
-                if result.source_shape:
-                    lines.append(f"    sh:sourceShape <{result.source_shape}> ;")
-                
-                lines.append(f'    :timestamp "{result.timestamp.isoformat()}"^^xsd:dateTime .')
-                lines.append("")
-        else:
-            lines.append("    .")
+        # Validation report header
+        header = _TURTLE_REPORT_HEADER.format(
+            report_uri=f":report_{report.timestamp.strftime('%Y%m%d_%H%M%S')}",
+            conforms=str(report.conforms).lower(),
+            timestamp=report.timestamp.isoformat(),
+            total=summary["total_results"],
+            violations=summary["violation_count"],
+            warnings=summary["warning_count"],
+            info=summary["info_count"]
+        )
         
-        return "\n".join(lines)
+        # Add validation results
+        result_count = summary["total_results"]
+        if not result_count:
+            yield header + "    .\n"
+            return
+        
+        yield header + "    sh:result\n" + "".join([
+            f"        :result_{i} ,\n" for i in range(1, result_count)
+        ]) + f"        :result_{result_count} .\n"
+        
+        # Define each validation result
+        columns = zip(
+            report._focus_nodes, report._result_paths, report._values,
+            report._messages, report._severity_codes, report._severities,
+            report._source_constraints, report._source_shapes
+        )
+        for i, (focus_node, result_path, value, message, code, severity,
+                source_constraint, source_shape) in enumerate(columns, 1):
+            yield "".join((
+                _RESULT_TMPL.format(uri=f":result_{i}", focus=focus_node),
+                _RESULT_PATH_TMPL.format(result_path) if result_path else "",
+                _VALUE_TMPL.format(_esc(str(value))) if value else "",
+                _MESSAGE_TMPL.format(_esc(message)),
+                _SEVERITY_TMPL.format(severity)
+                if code == SeverityCode.UNKNOWN else _SEVERITY_LINES[code],
+                _SOURCE_CONSTRAINT_TMPL.format(source_constraint)
+                if source_constraint else "",
+                _SOURCE_SHAPE_TMPL.format(source_shape) if source_shape else "",
+                # Results share the report timestamp emitted in the header
+                _SEQUENCE_TMPL.format(i - 1)
+            ))
     
     def format_report(
         self,
         report: ValidationReport,
         format: str = "text",
-        include_details: bool = True
-    ) -> str:
+        include_details: bool = True,
+        file: Optional[TextIO] = None
+    ) -> Optional[str]:
         """
         Format validation report as human-readable text.
         
@@ -688,127 +1376,137 @@ class SHACLValidator:
             report: ValidationReport to format
             format: Output format ("text", "markdown", "html")
             include_details: Whether to include detailed results
+            file: Optional text stream to write the report to line by line
+                instead of building and returning one string
         
         Returns:
-            Formatted report string
+            Formatted report string, or None when written to file
         """
         if format == "text":
-            return self._format_text_report(report, include_details)
+            lines = self._iter_text_report(report, include_details)
         elif format == "markdown":
-            return self._format_markdown_report(report, include_details)
+            lines = self._iter_markdown_report(report, include_details)
         else:
             raise ValidationExecutionError(f"Unsupported format: {format}")
+        
+        if file is None:
+            return "\n".join(lines)
+        
+        # Same text as the returned string: newline-separated, none at the end
+        write = file.write
+        write(next(lines))
+        for line in lines:
+            write("\n")
+            write(line)
+        return None
     
-    def _format_text_report(
+    def _iter_text_report(
         self,
         report: ValidationReport,
         include_details: bool
-    ) -> str:
-        """Format report as plain text."""
-        lines = []
-        lines.append("=" * 70)
-        lines.append("SHACL VALIDATION REPORT")
-        lines.append("=" * 70)
-        lines.append(f"Timestamp: {report.timestamp.isoformat()}")
-        lines.append(f"Conforms: {report.conforms}")
-        lines.append("")
+    ) -> Iterator[str]:
+        """Yield the lines of the plain text report."""
+        yield "=" * 70
+        yield "SHACL VALIDATION REPORT"
+        yield "=" * 70
+        yield f"Timestamp: {report.timestamp.isoformat()}"
+        yield f"Conforms: {report.conforms}"
+        yield ""
         
         summary = self.get_summary(report)
-        lines.append("SUMMARY")
-        lines.append("-" * 70)
-        lines.append(f"Total Results:    {summary['total_results']}")
-        lines.append(f"Violations:       {summary['violation_count']}")
-        lines.append(f"Warnings:         {summary['warning_count']}")
-        lines.append(f"Info:             {summary['info_count']}")
-        lines.append(f"Affected Nodes:   {summary['affected_nodes']}")
-        lines.append("")
-        
-        if include_details and report.results:
-            lines.append("DETAILED RESULTS")
-            lines.append("-" * 70)
+        yield "SUMMARY"
+        yield "-" * 70
+        yield f"Total Results:    {summary['total_results']}"
+        yield f"Violations:       {summary['violation_count']}"
+        yield f"Warnings:         {summary['warning_count']}"
+        yield f"Info:             {summary['info_count']}"
+        yield f"Affected Nodes:   {summary['affected_nodes']}"
+        yield ""
+        
+        if include_details and summary['total_results']:
+            yield "DETAILED RESULTS"
+            yield "-" * 70
             
             # Group by severity
-            for severity in [SeverityLevel.VIOLATION, SeverityLevel.WARNING, SeverityLevel.INFO]:
-                results = report.get_results_by_severity(severity)
+            for code, results in enumerate(_bucket_by_severity(report)):
                 if results:
-                    severity_label = SeverityLevel.get_label(severity)
-                    lines.append(f"\n{severity_label}s ({len(results)}):")
-                    lines.append("")
-                    
-                    for i, result in enumerate(results, 1):
-                        lines.append(f"  {i}. Focus Node: {result.focus_node}")
-                        if result.result_path:
-                            lines.append(f"     Path: {result.result_path}")
-                        if result.value:
-                            lines.append(f"     Value: {result.value}")
-                        lines.append(f"     Message: {result.message}")
-                        if result.source_shape:
-                            lines.append(f"     Shape: {result.source_shape}")
-                        lines.append("")
-        
-        lines.append("=" * 70)
-        return "\n".join(lines)
-    
-    def _format_markdown_report(
+                    severity_label = _SEVERITY_LABELS[code]
+                    yield f"\n{severity_label}s ({len(results)}):"
+                    yield ""
+                    yield from (
+                        _text_result_block(i, result)
+                        for i, result in enumerate(results, 1)
+                    )
+        
+        yield "=" * 70
+    
+    def _iter_markdown_report(
         self,
         report: ValidationReport,
         include_details: bool
-    ) -> str:
-        """Format report as Markdown."""
-        lines = []
-        lines.append("# SHACL Validation Report")
-        lines.append("")
-        lines.append(f"**Timestamp:** {report.timestamp.isoformat()}")
-        lines.append(f"**Conforms:** {report.conforms}")
-        lines.append("")
+    ) -> Iterator[str]:
+        """Yield the lines of the Markdown report."""
+        yield "# SHACL Validation Report"
+        yield ""
+        yield f"**Timestamp:** {report.timestamp.isoformat()}"
+        yield f"**Conforms:** {report.conforms}"
+        yield ""
         
         summary = self.get_summary(report)
-        lines.append("## Summary")
-        lines.append("")
-        lines.append("| Metric | Count |")
-        lines.append("|--------|-------|")
-        lines.append(f"| Total Results | {summary['total_results']} |")
-        lines.append(f"| Violations | {summary['violation_count']} |")
-        lines.append(f"| Warnings | {summary['warning_count']} |")
-        lines.append(f"| Info | {summary['info_count']} |")
-        lines.append(f"| Affected Nodes | {summary['affected_nodes']} |")
-        lines.append("")
-        
-        if include_details and report.results:
-            lines.append("## Detailed Results")
-            lines.append("")
+        yield "## Summary"
+        yield ""
+        yield "| Metric | Count |"
+        yield "|--------|-------|"
+        yield f"| Total Results | {summary['total_results']} |"
+        yield f"| Violations | {summary['violation_count']} |"
+        yield f"| Warnings | {summary['warning_count']} |"
+        yield f"| Info | {summary['info_count']} |"
+        yield f"| Affected Nodes | {summary['affected_nodes']} |"
+        yield ""
+        
+        if include_details and summary['total_results']:
+            yield "## Detailed Results"
+            yield ""
             
-            for severity in [SeverityLevel.VIOLATION, SeverityLevel.WARNING, SeverityLevel.INFO]:
-                results = report.get_results_by_severity(severity)
+            for code, results in enumerate(_bucket_by_severity(report)):
                 if results:
-                    severity_label = SeverityLevel.get_label(severity)
-                    lines.append(f"### {severity_label}s ({len(results)})")
-                    lines.append("")
-                    
-                    for i, result in enumerate(results, 1):
-                        lines.append(f"**{i}. {result.focus_node}**")
-                        lines.append("")
-                        if result.result_path:
-                            lines.append(f"- **Path:** `{result.result_path}`")
-                        if result.value:
-                            lines.append(f"- **Value:** `{result.value}`")
-                        lines.append(f"- **Message:** {result.message}")
-                        if result.source_shape:
-                            lines.append(f"- **Shape:** `{result.source_shape}`")
-                        lines.append("")
-        
-        return "\n".join(lines)
+                    severity_label = _SEVERITY_LABELS[code]
+                    yield f"### {severity_label}s ({len(results)})"
+                    yield ""
+                    yield from (
+                        _markdown_result_block(i, result)
+                        for i, result in enumerate(results, 1)
+                    )
     
     def clear_shapes(self) -> None:
         """Clear all loaded SHACL shapes."""
-        self.shapes_data.clear()
-        self.loaded_shape_files.clear()
+        with self._shapes_lock:
+            self.shapes_data.clear()
+            self.loaded_shape_files.clear()
+            self._content_by_hash.clear()
         logger.info("SHACL shapes cleared")
     
+    @staticmethod
+    def clear_shape_cache() -> None:
+        """
+        Drop the process-wide caches of shapes files and directories.
+        
+        Shapes already loaded into validators are not affected.
+        """
+        with _SHAPES_CACHE_LOCK:
+            _SHAPES_CACHE.clear()
+        _DIR_CACHE.clear()
+        logger.info("Shapes file cache cleared")
+    
     def get_loaded_shapes(self) -> List[str]:
         """Get list of loaded shape files."""
         return self.loaded_shape_files.copy()
     
+    @property
+    def shape_count(self) -> int:
+        """Number of loaded shape files, without copying the list."""
+        return len(self.loaded_shape_files)
+    
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get validator statistics.
@@ -817,7 +1515,7 @@ class SHACLValidator:
             Dictionary with validator statistics
         """
         return {
-            'shapes_loaded': len(self.loaded_shape_files),
+            'shapes_loaded': self.shape_count,
             'validation_count': self.validation_count,
             'shape_files': self.loaded_shape_files.copy()
         }
@@ -859,14 +1557,32 @@ def create_validator(
     # Create validator
     validator = SHACLValidator(loader)
     
-    # Load shapes from validation directory
-    validation_path = Path(validation_dir)
-    if validation_path.exists():
+    # Load shapes from validation directory, skipping the scan when it is
+    # unchanged since the last validator was created
+    dir_key = os.path.abspath(validation_dir)
+    try:
+        dir_mtime_ns = os.stat(dir_key).st_mtime_ns
+    except OSError:
+        dir_mtime_ns = None
+    
+    if dir_mtime_ns is not None and _reuse_shapes_directory(validator, dir_key, dir_mtime_ns):
+        logger.info("Reused %d unchanged shape files", validator.shape_count)
+    elif dir_mtime_ns is not None:
         try:
-            validator.load_shapes_directory(validation_dir)
-            logger.info(f"Loaded {len(validator.loaded_shape_files)} shape files")
-        except Exception as e:
-            logger.warning(f"Error loading shapes: {str(e)}")
+            successful, failed = validator.load_shapes_directory(validation_dir)
+            logger.info("Loaded %d shape files", validator.shape_count)
+            
+            entries = [
+                (path, _SHAPES_CACHE.get(os.path.abspath(path)))
+                for path in successful
+            ]
+            if not failed and all(cached is not None for _, cached in entries):
+                _DIR_CACHE[dir_key] = (
+                    dir_mtime_ns,
+                    tuple((path, cached[0]) for path, cached in entries)
+                )
+        except (ShapeLoadError, OSError) as e:
+            logger.warning("Error loading shapes: %s", e)
     
     logger.info("SHACL validator created successfully")
     
@@ -883,7 +1599,7 @@ if __name__ == "__main__":
         validator = create_validator()
         
         print(f"Validator created")
-        print(f"Shapes loaded: {len(validator.get_loaded_shapes())}")
+        print(f"Shapes loaded: {validator.shape_count}")
         
         # Execute validation
         print("\nExecuting validation...")
@@ -10,10 +10,16 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
-from ontology.query import SPARQLQueryEngine, create_query_engine, EXAMPLE_QUERIES
-from ontology.loader import load_ontology_files
+from ontology.query import (
+    SPARQLQueryEngine,
+    create_query_engine,
+    EXAMPLE_QUERIES,
+    PREPARED_EXAMPLE_QUERIES
+)
+from testutils import buffered_output, get_shared_loader
 
 
+@buffered_output
 def test_query_validation():
     """Test query validation functionality."""
     print("\n" + "=" * 60)
@@ -49,6 +55,7 @@ def test_query_validation():
         print(f"  ✗ {name}: {result['message']}")
 
 
+@buffered_output
 def test_query_type_detection():
     """Test query type detection."""
     print("\n" + "=" * 60)
@@ -62,6 +69,7 @@ def test_query_type_detection():
         print(f"  {name}: {query_type.value}")
 
 
+@buffered_output
 def test_timeout_calculation():
     """Test timeout calculation based on triple count."""
     print("\n" + "=" * 60)
@@ -82,6 +90,7 @@ def test_timeout_calculation():
         print(f"  {description}: {timeout}s timeout")
 
 
+@buffered_output
 def test_feature_support():
     """Test feature support checking."""
     print("\n" + "=" * 60)
@@ -104,15 +113,16 @@ def test_feature_support():
         print(f"  {status} {feature}")
 
 
-def test_with_loaded_data():
+@buffered_output
+def test_with_loaded_data(shared_loader):
     """Test query engine with loaded ontology data."""
     print("\n" + "=" * 60)
     print("TEST: Query Engine with Loaded Data")
     print("=" * 60)
     
     try:
-        # Load ontology files
-        loader = load_ontology_files()
+        # Ontology files are loaded once and shared between tests
+        loader = shared_loader
         print(f"\nLoaded {loader.get_triple_count()} files")
         print(f"Registered namespaces: {list(loader.get_namespaces().keys())}")
         
@@ -128,7 +138,7 @@ def test_with_loaded_data():
         # Test query execution (will show warnings about maplib implementation)
         print("\nTesting query execution:")
         try:
-            result = engine.execute_select(EXAMPLE_QUERIES['select_all'])
+            result = engine.execute_prepared(PREPARED_EXAMPLE_QUERIES['select_all'])
             print(f"  ✓ SELECT query executed (returned {len(result)} results)")
         except Exception as e:
             print(f"  ✗ SELECT query failed: {str(e)}")
@@ -143,6 +153,7 @@ def test_with_loaded_data():
         print(f"Error: {str(e)}")
 
 
+@buffered_output
 def test_parameterized_queries():
     """Test parameterized query execution."""
     print("\n" + "=" * 60)
@@ -175,7 +186,7 @@ def main():
     test_query_type_detection()
     test_timeout_calculation()
     test_feature_support()
-    test_with_loaded_data()
+    test_with_loaded_data(get_shared_loader())
     test_parameterized_queries()
     
     print("\n" + "=" * 60)
@@ -4,12 +4,17 @@ Test script for SHACL Validator
 This script demonstrates the functionality of the SHACL validator.
 """
 
+import io
+import os
 import sys
+import tempfile
+import time
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
+from ontology import validator as validator_module
 from ontology.validator import (
     SHACLValidator, 
     ValidationReport, 
@@ -17,9 +22,10 @@ from ontology.validator import (
     SeverityLevel,
     create_validator
 )
-from ontology.loader import load_ontology_files
+from testutils import buffered_output, get_shared_loader
 
 
+@buffered_output
 def test_severity_levels():
     """Test severity level functionality."""
     print("\n" + "=" * 60)
@@ -32,6 +38,7 @@ def test_severity_levels():
         print(f"  {label}: {level}")
 
 
+@buffered_output
 def test_validation_result():
     """Test ValidationResult class."""
     print("\n" + "=" * 60)
@@ -58,6 +65,7 @@ def test_validation_result():
         print(f"  {key}: {value}")
 
 
+@buffered_output
 def test_validation_report():
     """Test ValidationReport class."""
     print("\n" + "=" * 60)
@@ -92,8 +100,7 @@ def test_validation_report():
         ),
     ]
     
-    for result in results:
-        report.add_result(result)
+    report.add_results(results)
     
     print(f"\nValidation Report: {report}")
     
@@ -105,8 +112,227 @@ def test_validation_report():
     print(f"\nViolations: {len(report.get_violations())}")
     print(f"Warnings: {len(report.get_warnings())}")
     print(f"Info: {len(report.get_info())}")
+    
+    # Integer codes work like URIs; codes outside SeverityCode are rejected
+    assert report.get_results_by_severity(0) == report.get_violations()
+    assert report.get_results_by_severity(SeverityLevel.INFO) == report.get_info()
+    assert report.get_results_by_severity("http://example.org/custom") == []
+    for code in (-1, 4, 99):
+        try:
+            report.get_results_by_severity(code)
+        except ValueError as e:
+            assert str(e) == f"Unknown severity code: {code}"
+        else:
+            raise AssertionError(f"severity code {code} was accepted")
+    print("✓ Unknown severity codes raise ValueError")
+
+
+@buffered_output
+def test_duplicate_results():
+    """Test how duplicate results are counted and indexed, with and without dedupe."""
+    print("\n" + "=" * 60)
+    print("TEST: Duplicate Results")
+    print("=" * 60)
+    
+    def make_results():
+        warning = ValidationResult(
+            focus_node="http://example.org/entity1",
+            result_path="http://example.org/ontology#hasDescription",
+            value=None,
+            message="Entity should have a description",
+            severity=SeverityLevel.WARNING,
+            source_shape="http://example.org/ontology#EntityShape"
+        )
+        violation = ValidationResult(
+            focus_node="http://example.org/entity2",
+            result_path="http://example.org/ontology#hasIdentifier",
+            value=None,
+            message="Entity must have exactly one identifier",
+            severity=SeverityLevel.VIOLATION,
+            source_shape="http://example.org/ontology#IdentifierShape"
+        )
+        return warning, violation
+    
+    # Deduplicating report (the default): repeats are dropped on insert,
+    # whether added one by one or in a batch
+    report = ValidationReport(conforms=True)
+    warning, violation = make_results()
+    report.add_result(warning)
+    report.add_result(make_results()[0])
+    assert report.conforms
+    report.add_results([violation, warning, make_results()[1]])
+    
+    summary = report.get_summary()
+    assert summary['total_results'] == 2
+    assert summary['warning_count'] == 1
+    assert summary['violation_count'] == 1
+    assert not report.conforms
+    assert dict(report._by_focus) == {
+        "http://example.org/entity1": [0],
+        "http://example.org/entity2": [1]
+    }
+    assert dict(report._by_shape) == {
+        "http://example.org/ontology#EntityShape": [0],
+        "http://example.org/ontology#IdentifierShape": [1]
+    }
+    assert [r.focus_node for r in report.get_violations()] == ["http://example.org/entity2"]
+    print(f"\n✓ dedupe=True keeps {summary['total_results']} of 5 results")
+    
+    # Raw report: every result is kept and indexed
+    raw = ValidationReport(conforms=True, dedupe=False)
+    warning, violation = make_results()
+    raw.add_result(warning)
+    raw.add_result(make_results()[0])
+    assert raw.conforms
+    raw.add_results([violation, warning, make_results()[1]])
+    
+    summary = raw.get_summary()
+    assert summary['total_results'] == 5
+    assert summary['warning_count'] == 3
+    assert summary['violation_count'] == 2
+    assert not raw.conforms
+    assert dict(raw._by_focus) == {
+        "http://example.org/entity1": [0, 1, 3],
+        "http://example.org/entity2": [2, 4]
+    }
+    assert dict(raw._by_shape) == {
+        "http://example.org/ontology#EntityShape": [0, 1, 3],
+        "http://example.org/ontology#IdentifierShape": [2, 4]
+    }
+    assert len(raw.get_violations()) == 2
+    assert len(raw.get_results_by_focus_node()["http://example.org/entity1"]) == 3
+    print(f"✓ dedupe=False keeps all {summary['total_results']} results")
+    
+    # Unhashable values can be deduplicated too; equal-looking values of
+    # different types are still told apart
+    def list_result(value):
+        return ValidationResult(
+            focus_node="http://example.org/entity3",
+            result_path="http://example.org/ontology#hasTags",
+            value=value,
+            message="Tags must be unique",
+            severity=SeverityLevel.WARNING
+        )
+    
+    lists = ValidationReport(conforms=True)
+    lists.add_result(list_result(["a", "b"]))
+    lists.add_results([list_result(["a", "b"]), list_result(["a", "c"])])
+    lists.add_results([list_result(1), list_result("1")])
+    assert lists.get_summary()['total_results'] == 4
+    assert lists._by_focus["http://example.org/entity3"] == [0, 1, 2, 3]
+    
+    raw_lists = ValidationReport(conforms=True, dedupe=False)
+    raw_lists.add_result(list_result(["a", "b"]))
+    raw_lists.add_results([list_result(["a", "b"])])
+    assert raw_lists.get_summary()['total_results'] == 2
+    print("✓ Results with list values are deduplicated")
 
 
+@buffered_output
+def test_bulk_add_and_merge():
+    """Test counts, indexes and conforms after add_results and merge."""
+    print("\n" + "=" * 60)
+    print("TEST: Bulk Add and Merge")
+    print("=" * 60)
+    
+    entity_shape = "http://example.org/ontology#EntityShape"
+    value_shape = "http://example.org/ontology#ValueShape"
+    
+    # A batch without violations keeps the report conforming
+    first = ValidationReport(conforms=True)
+    first.add_results([
+        ValidationResult(
+            focus_node="http://example.org/entity1",
+            result_path="http://example.org/ontology#hasDescription",
+            value=None,
+            message="Entity should have a description",
+            severity=SeverityLevel.WARNING,
+            source_shape=entity_shape
+        ),
+        ValidationResult(
+            focus_node="http://example.org/entity2",
+            result_path="http://example.org/ontology#hasValue",
+            value="123",
+            message="Entity may have a numeric value",
+            severity=SeverityLevel.INFO,
+            source_shape=value_shape
+        ),
+    ])
+    first.add_results([])
+    
+    summary = first.get_summary()
+    assert first.conforms
+    assert summary['total_results'] == 2
+    assert (summary['violation_count'], summary['warning_count'], summary['info_count']) == (0, 1, 1)
+    print("\n✓ add_results without violations keeps conforms")
+    
+    second = ValidationReport(conforms=True)
+    second.add_results([
+        ValidationResult(
+            focus_node="http://example.org/entity2",
+            result_path="http://example.org/ontology#hasIdentifier",
+            value=None,
+            message="Entity must have exactly one identifier",
+            severity=SeverityLevel.VIOLATION,
+            source_shape=entity_shape
+        ),
+        ValidationResult(
+            focus_node="http://example.org/entity3",
+            result_path=None,
+            value=None,
+            message="Shape is unknown",
+            severity=SeverityLevel.WARNING
+        ),
+    ])
+    assert not second.conforms
+    print("✓ add_results with a violation clears conforms")
+    
+    # Merging appends the other report's results after this report's own
+    first.merge(second)
+    
+    summary = first.get_summary()
+    assert not first.conforms
+    assert summary['total_results'] == 4
+    assert (summary['violation_count'], summary['warning_count'], summary['info_count']) == (1, 2, 1)
+    assert dict(first._by_focus) == {
+        "http://example.org/entity1": [0],
+        "http://example.org/entity2": [1, 2],
+        "http://example.org/entity3": [3]
+    }
+    assert dict(first._by_shape) == {
+        entity_shape: [0, 2],
+        value_shape: [1],
+        "Unknown": [3]
+    }
+    assert [r.focus_node for r in first.get_warnings()] == [
+        "http://example.org/entity1", "http://example.org/entity3"
+    ]
+    assert [r.sequence for r in first.results] == [0, 1, 2, 3]
+    print(f"✓ merge combines counts and indexes: {first}")
+    
+    # Without dedupe the results are copied column by column; the merged
+    # report conforms only if both did
+    raw = ValidationReport(conforms=True, dedupe=False)
+    raw.merge(first)
+    raw.merge(first)
+    
+    summary = raw.get_summary()
+    assert not raw.conforms
+    assert summary['total_results'] == 8
+    assert summary['violation_count'] == 2
+    assert raw._by_focus["http://example.org/entity2"] == [1, 2, 5, 6]
+    assert raw._by_shape["Unknown"] == [3, 7]
+    print("✓ merge with dedupe=False keeps every result")
+    
+    non_conforming = ValidationReport(conforms=False)
+    merged = ValidationReport(conforms=True)
+    merged.merge(non_conforming)
+    assert not merged.conforms
+    assert merged.get_summary()['total_results'] == 0
+    print("✓ merge keeps a non-conforming status without results")
+
+
+@buffered_output
 def test_shape_loading():
     """Test loading SHACL shapes."""
     print("\n" + "=" * 60)
@@ -117,38 +343,118 @@ def test_shape_loading():
     
     # Test loading single shape file
     shapes_file = Path("validation/shapes.ttl")
-    if shapes_file.exists():
-        try:
-            validator.load_shapes(shapes_file)
-            print(f"\n✓ Loaded shapes from: {shapes_file}")
-            print(f"  Total shape files loaded: {len(validator.get_loaded_shapes())}")
-        except Exception as e:
-            print(f"\n✗ Failed to load shapes: {str(e)}")
-    else:
+    try:
+        validator.load_shapes(shapes_file)
+        print(f"\n✓ Loaded shapes from: {shapes_file}")
+        print(f"  Total shape files loaded: {validator.shape_count}")
+    except FileNotFoundError:
         print(f"\n✗ Shapes file not found: {shapes_file}")
+    except Exception as e:
+        print(f"\n✗ Failed to load shapes: {str(e)}")
     
     # Test loading from directory
     validator2 = SHACLValidator()
     validation_dir = Path("validation")
-    if validation_dir.exists():
+    try:
+        successful, failed = validator2.load_shapes_directory(validation_dir)
+        print(f"\n✓ Loaded shapes from directory: {validation_dir}")
+        print(f"  Successful: {len(successful)}")
+        print(f"  Failed: {len(failed)}")
+    except FileNotFoundError:
+        print(f"\n✗ Shapes directory not found: {validation_dir}")
+    except Exception as e:
+        print(f"\n✗ Failed to load shapes directory: {str(e)}")
+
+
+@buffered_output
+def test_shapes_cache():
+    """Test reuse, invalidation and bounding of the shapes file cache."""
+    print("\n" + "=" * 60)
+    print("TEST: Shapes File Cache")
+    print("=" * 60)
+    
+    SHACLValidator.clear_shape_cache()
+    with tempfile.TemporaryDirectory() as tmp:
+        shapes_file = Path(tmp) / "shapes.ttl"
+        shapes_file.write_bytes(b"# first\n")
+        key = os.path.abspath(shapes_file)
+    
+        SHACLValidator().load_shapes(shapes_file)
+        cached = validator_module._SHAPES_CACHE[key]
+        SHACLValidator().load_shapes(shapes_file)
+        assert validator_module._SHAPES_CACHE[key] is cached
+        print("\n✓ Unchanged file reused from the cache")
+    
+        # Same size, later mtime: the new content must be read
+        shapes_file.write_bytes(b"# other\n")
+        os.utime(shapes_file, ns=(cached[0] + 10**9, cached[0] + 10**9))
+        validator = SHACLValidator()
+        validator.load_shapes(shapes_file)
+        assert validator.shapes_data[0]['content_bytes'] == b"# other\n"
+        assert validator_module._SHAPES_CACHE[key] is not cached
+        print("✓ Modified file reloaded")
+    
+        # Oldest entries are evicted once the bound is reached
+        max_files = validator_module._SHAPES_CACHE_MAX_FILES
+        validator_module._SHAPES_CACHE_MAX_FILES = 2
         try:
-            successful, failed = validator2.load_shapes_directory(validation_dir)
-            print(f"\n✓ Loaded shapes from directory: {validation_dir}")
-            print(f"  Successful: {len(successful)}")
-            print(f"  Failed: {len(failed)}")
-        except Exception as e:
-            print(f"\n✗ Failed to load shapes directory: {str(e)}")
+            SHACLValidator.clear_shape_cache()
+            paths = []
+            for i in range(3):
+                path = Path(tmp) / f"shapes{i}.ttl"
+                path.write_bytes(f"# shapes {i}\n".encode())
+                SHACLValidator().load_shapes(path)
+                paths.append(os.path.abspath(path))
+            assert list(validator_module._SHAPES_CACHE) == paths[1:]
+            print("✓ Cache bounded, oldest file evicted")
+        finally:
+            validator_module._SHAPES_CACHE_MAX_FILES = max_files
+            SHACLValidator.clear_shape_cache()
+
+
+@buffered_output
+def test_shapes_content_dedupe():
+    """Test that identical shapes content from several paths is stored once."""
+    print("\n" + "=" * 60)
+    print("TEST: Shapes Content Dedupe")
+    print("=" * 60)
+    
+    SHACLValidator.clear_shape_cache()
+    with tempfile.TemporaryDirectory() as tmp:
+        first = Path(tmp) / "shapes.ttl"
+        copy = Path(tmp) / "shapes_copy.ttl"
+        first.write_bytes(b"# shared shapes\n")
+        copy.write_bytes(b"# shared shapes\n")
+    
+        validator = SHACLValidator()
+        validator.load_shapes(first)
+        validator.load_shapes(copy)
+        assert validator.loaded_shape_files == [str(first), str(copy)]
+        assert len(validator.shapes_data) == 1
+        assert validator.shapes_data[0]['file'] == str(first)
+        print("\n✓ Same content from two paths stored once")
+    
+        changed = Path(tmp) / "shapes_changed.ttl"
+        changed.write_bytes(b"# changed shapes\n")
+        validator.load_shapes(changed)
+        assert validator.shape_count == 3
+        assert [entry['content_bytes'] for entry in validator.shapes_data] == [
+            b"# shared shapes\n", b"# changed shapes\n"
+        ]
+        print("✓ Different content still stored")
+    SHACLValidator.clear_shape_cache()
 
 
-def test_validator_with_data():
+@buffered_output
+def test_validator_with_data(shared_loader):
     """Test validator with loaded RDF data."""
     print("\n" + "=" * 60)
     print("TEST: Validator with Loaded Data")
     print("=" * 60)
     
     try:
-        # Load ontology files
-        loader = load_ontology_files()
+        # Ontology files are loaded once and shared between tests
+        loader = shared_loader
         print(f"\nLoaded {loader.get_triple_count()} files")
         
         # Create validator
@@ -156,9 +462,11 @@ def test_validator_with_data():
         
         # Load shapes
         shapes_file = Path("validation/shapes.ttl")
-        if shapes_file.exists():
+        try:
             validator.load_shapes(shapes_file)
             print(f"Loaded shapes from: {shapes_file}")
+        except FileNotFoundError:
+            print(f"Shapes file not found: {shapes_file}")
         
         # Get validator statistics
         stats = validator.get_statistics()
@@ -187,6 +495,81 @@ def test_validator_with_data():
         print(f"Error: {str(e)}")
 
 
+@buffered_output
+def test_parallel_validation():
+    """Test that parallel validation matches a serial run."""
+    print("\n" + "=" * 60)
+    print("TEST: Parallel Validation")
+    print("=" * 60)
+    
+    severities = [SeverityLevel.VIOLATION, SeverityLevel.WARNING, SeverityLevel.INFO]
+    
+    def fake_simulation(report, focus_filter=None, shapes=None, inference='none', advanced=False):
+        # Stand-in for the maplib call: results per shapes entry, with the
+        # earlier entries finishing last and one result shared by all
+        for entry in shapes:
+            index = int(entry['content_bytes'].split()[-1])
+            time.sleep(0.01 * (4 - index))
+            report.add_results([
+                ValidationResult(
+                    focus_node=f"http://example.org/entity{index}",
+                    result_path=None,
+                    value=None,
+                    message=f"Result {n} from shapes {index}",
+                    severity=severities[(index + n) % 3],
+                    source_shape=entry['file']
+                )
+                for n in range(3)
+            ])
+            report.add_result(ValidationResult(
+                focus_node="http://example.org/shared",
+                result_path=None,
+                value=None,
+                message="Reported by every shapes file",
+                severity=SeverityLevel.WARNING
+            ))
+    
+    def run(parallel):
+        validator = SHACLValidator(parallel=parallel)
+        for path in paths:
+            validator.load_shapes(path)
+        validator._simulate_validation = fake_simulation
+        return validator.validate(data_graph=object())
+    
+    SHACLValidator.clear_shape_cache()
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for index in range(4):
+            path = Path(tmp) / f"shapes{index}.ttl"
+            path.write_bytes(f"# shapes {index}".encode())
+            paths.append(path)
+    
+        serial = run(parallel=False)
+        parallel = run(parallel=True)
+    SHACLValidator.clear_shape_cache()
+    
+    def counts(report):
+        summary = report.get_summary()
+        del summary['timestamp']
+        return summary
+    
+    def keys(results):
+        return [(r.focus_node, r.message, r.severity, r.source_shape) for r in results]
+    
+    assert len(serial.results) == 13
+    assert not serial.conforms
+    assert counts(parallel) == counts(serial)
+    print("\n✓ Same counts and conforms as the serial run")
+    
+    assert keys(parallel.results) == keys(serial.results)
+    for severity in severities:
+        assert keys(parallel.get_results_by_severity(severity)) == keys(
+            serial.get_results_by_severity(severity)
+        )
+    print("✓ Same result order as the serial run")
+
+
+@buffered_output
 def test_report_formatting():
     """Test validation report formatting."""
     print("\n" + "=" * 60)
@@ -226,8 +609,22 @@ def test_report_formatting():
     print("\n--- Markdown Format ---")
     md_report = validator.format_report(report, format="markdown", include_details=True)
     print(md_report)
+    
+    # Writing to a stream gives exactly the returned text
+    for report_format in ("text", "markdown"):
+        for include_details in (True, False):
+            expected = validator.format_report(
+                report, format=report_format, include_details=include_details
+            )
+            stream = io.StringIO()
+            assert validator.format_report(
+                report, format=report_format, include_details=include_details, file=stream
+            ) is None
+            assert stream.getvalue() == expected, f"{report_format} report differs when written to a file"
+    print("\n✓ Reports written to a file match the returned strings")
 
 
+@buffered_output
 def test_report_export():
     """Test exporting validation reports."""
     print("\n" + "=" * 60)
@@ -258,18 +655,94 @@ def test_report_export():
         print(f"\n✓ Report exported to: {output_file}")
         
         # Read and display the exported file
-        if output_file.exists():
-            print(f"\nExported content (first 20 lines):")
-            with open(output_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                for line in lines[:20]:
-                    print(f"  {line.rstrip()}")
-                if len(lines) > 20:
-                    print(f"  ... ({len(lines) - 20} more lines)")
+        with open(output_file, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+        print(f"\nExported content (first 20 lines):")
+        for line in lines[:20]:
+            print(f"  {line.rstrip()}")
+        if len(lines) > 20:
+            print(f"  ... ({len(lines) - 20} more lines)")
     except Exception as e:
         print(f"\n✗ Export failed: {str(e)}")
 
 
+@buffered_output
+def test_turtle_export_content():
+    """Test escaping, timestamp and sequence numbers in the Turtle export."""
+    print("\n" + "=" * 60)
+    print("TEST: Turtle Export Content")
+    print("=" * 60)
+    
+    report = ValidationReport(conforms=False)
+    
+    report.add_results([
+        ValidationResult(
+            focus_node="http://example.org/entity1",
+            result_path="http://example.org/ontology#hasName",
+            value='say "hi"',
+            message='Name "say \\"hi\\"" is not allowed\nUse a plain name',
+            severity=SeverityLevel.VIOLATION,
+            source_shape="http://example.org/ontology#EntityShape"
+        ),
+        ValidationResult(
+            focus_node="http://example.org/entity2",
+            result_path="http://example.org/ontology#hasPath",
+            value="C:\\data\\file.ttl",
+            message="Path must not\r\ncontain\ttabs",
+            severity=SeverityLevel.WARNING,
+            source_shape="http://example.org/ontology#EntityShape"
+        ),
+    ])
+    
+    validator = SHACLValidator()
+    turtle = validator._generate_turtle_report(report)
+    
+    # Quotes, backslashes and line breaks are escaped inside literals
+    assert '    sh:value "say \\"hi\\"" ;\n' in turtle
+    assert ('    sh:resultMessage "Name \\"say \\\\\\"hi\\\\\\"\\" is not allowed'
+            '\\nUse a plain name"@en ;\n') in turtle
+    assert '    sh:value "C:\\\\data\\\\file.ttl" ;\n' in turtle
+    assert '    sh:resultMessage "Path must not\\r\\ncontain\\ttabs"@en ;\n' in turtle
+    print("\n✓ Literals are escaped")
+    
+    # The header carries the report timestamp once for all results
+    timestamp = report.timestamp.isoformat()
+    assert f'    :timestamp "{timestamp}"^^xsd:dateTime ;\n' in turtle
+    print(f"✓ Header timestamp: {timestamp}")
+    
+    # Each result carries its position in the report
+    first, second = turtle.split("\n:result_1 a sh:ValidationResult ;\n")[1].split(
+        "\n:result_2 a sh:ValidationResult ;\n"
+    )
+    assert first.endswith("    :sequence 0 .\n")
+    assert second.endswith("    :sequence 1 .\n")
+    assert turtle.count(":sequence ") == 2
+    print("✓ Results carry sequence numbers 0 and 1")
+    
+    # Non-string values (numbers, rdflib-style terms) are stringified
+    class Term:
+        def __str__(self):
+            return 'http://example.org/"term"'
+    
+    values_report = ValidationReport(conforms=True)
+    values_report.add_results([
+        ValidationResult(
+            focus_node="http://example.org/entity3",
+            result_path="http://example.org/ontology#hasValue",
+            value=value,
+            message="Value is out of range",
+            severity=SeverityLevel.INFO
+        )
+        for value in (42, 2.5, Term())
+    ])
+    turtle = validator._generate_turtle_report(values_report)
+    assert '    sh:value "42" ;\n' in turtle
+    assert '    sh:value "2.5" ;\n' in turtle
+    assert '    sh:value "http://example.org/\\"term\\"" ;\n' in turtle
+    print("✓ Non-string values are exported")
+
+
+@buffered_output
 def test_result_grouping():
     """Test grouping validation results."""
     print("\n" + "=" * 60)
@@ -306,8 +779,7 @@ def test_result_grouping():
         ),
     ]
     
-    for result in results:
-        report.add_result(result)
+    report.add_results(results)
     
     validator = SHACLValidator()
     
@@ -322,8 +794,19 @@ def test_result_grouping():
     by_shape = validator.get_results_by_shape(report)
     for shape, shape_results in by_shape.items():
         print(f"  {shape}: {len(shape_results)} results")
+    
+    # Groupings hand out the report's own result objects, not copies
+    results = report.results
+    entity1_results = by_node["http://example.org/entity1"]
+    assert entity1_results[0] is results[0] and entity1_results[1] is results[1]
+    assert by_node["http://example.org/entity2"][0] is results[2]
+    shape_results = by_shape["http://example.org/ontology#EntityShape"]
+    assert all(a is b for a, b in zip(shape_results, results))
+    assert all(a is b for a, b in zip(report.get_violations(), results))
+    print("\n✓ Groupings reuse the results tuple")
 
 
+@buffered_output
 def test_create_validator():
     """Test convenience function for creating validator."""
     print("\n" + "=" * 60)
@@ -347,6 +830,69 @@ def test_create_validator():
         print(f"\n✗ Failed to create validator: {str(e)}")
 
 
+@buffered_output
+def test_create_validator_reuse():
+    """Test that create_validator reuses an unchanged shapes directory."""
+    print("\n" + "=" * 60)
+    print("TEST: Create Validator Shapes Directory Reuse")
+    print("=" * 60)
+    
+    def bump_mtime(path):
+        # Move the mtime on explicitly; coarse filesystem timestamps could
+        # otherwise leave it unchanged between two quick writes
+        mtime_ns = os.stat(path).st_mtime_ns + 10**9
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    
+    scans = []
+    load_shapes_directory = SHACLValidator.load_shapes_directory
+    
+    def counting_load(self, *args, **kwargs):
+        scans.append(args[0])
+        return load_shapes_directory(self, *args, **kwargs)
+    
+    SHACLValidator.clear_shape_cache()
+    SHACLValidator.load_shapes_directory = counting_load
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            shapes_dir = Path(tmp) / "validation"
+            shapes_dir.mkdir()
+            (shapes_dir / "a.ttl").write_bytes(b"# shapes a\n")
+            (shapes_dir / "b.ttl").write_bytes(b"# shapes b\n")
+            dirs = {
+                'ontology_dir': str(Path(tmp) / "ontology"),
+                'validation_dir': str(shapes_dir),
+                'data_dir': str(Path(tmp) / "data"),
+            }
+    
+            first = create_validator(**dirs)
+            assert len(scans) == 1
+            assert first.shape_count == 2
+            second = create_validator(**dirs)
+            assert len(scans) == 1, "unchanged directory was scanned again"
+            assert second.loaded_shape_files == first.loaded_shape_files
+            print("\n✓ Unchanged directory reused without a scan")
+    
+            (shapes_dir / "a.ttl").write_bytes(b"# shapes a, edited\n")
+            bump_mtime(shapes_dir / "a.ttl")
+            edited = create_validator(**dirs)
+            assert len(scans) == 2, "edited file did not trigger a reload"
+            contents = {entry['content_bytes'] for entry in edited.shapes_data}
+            assert b"# shapes a, edited\n" in contents
+            print("✓ Edited file triggers a reload")
+    
+            (shapes_dir / "c.ttl").write_bytes(b"# shapes c\n")
+            bump_mtime(shapes_dir)
+            added = create_validator(**dirs)
+            assert len(scans) == 3, "added file did not trigger a reload"
+            assert added.shape_count == 3
+            create_validator(**dirs)
+            assert len(scans) == 3
+            print("✓ Added file triggers a reload, then is reused")
+    finally:
+        SHACLValidator.load_shapes_directory = load_shapes_directory
+        SHACLValidator.clear_shape_cache()
+
+
 def main():
     """Run all tests."""
     print("\n" + "=" * 60)
@@ -356,12 +902,19 @@ def main():
     test_severity_levels()
     test_validation_result()
     test_validation_report()
+    test_duplicate_results()
+    test_bulk_add_and_merge()
     test_shape_loading()
-    test_validator_with_data()
+    test_shapes_cache()
+    test_shapes_content_dedupe()
+    test_validator_with_data(get_shared_loader())
+    test_parallel_validation()
     test_report_formatting()
     test_report_export()
+    test_turtle_export_content()
     test_result_grouping()
     test_create_validator()
+    test_create_validator_reuse()
     
     print("\n" + "=" * 60)
     print("All tests completed!")
@@ -0,0 +1,42 @@
+"""
+Helpers shared by the test scripts.
+
+Kept out of conftest.py so the scripts can import them when run
+standalone (python test_*.py) as well as under pytest.
+"""
+
+import functools
+import io
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from ontology.loader import load_ontology_files
+
+
+def buffered_output(func):
+    """Collect a test's printed output and write it to stdout in one go."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        buf = io.StringIO()
+        try:
+            with redirect_stdout(buf):
+                return func(*args, **kwargs)
+        finally:
+            sys.stdout.write(buf.getvalue())
+            sys.stdout.flush()
+    return wrapper
+
+
+@functools.lru_cache(maxsize=None)
+def get_shared_loader():
+    """
+    RDF loader with the ontology files, loaded on first use and reused.
+    
+    Backs conftest.py's shared_loader fixture and the scripts' main()
+    functions, so both load the files once per process.
+    """
+    return load_ontology_files()
@@ -9,10 +9,28 @@ Usage:
     python verify_graph_explorer_config.py
 """
 
+import atexit
+import functools
+import json
 import sys
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 import requests
-from typing import Dict, Any, Tuple
+from requests.adapters import HTTPAdapter
+from typing import Callable, Dict, Any, List, NamedTuple, Optional, Tuple
+
+# Optional: lets the data check stop reading /triples early
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional: faster JSON decoding of API responses
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 
 
 # Configuration
@@ -20,6 +38,46 @@ API_BASE_URL = "http://localhost:8000"
 GRAPH_EXPLORER_URL = "http://localhost:3000"
 TIMEOUT = 10
 
+# Time budget in seconds for a whole verification run; requests made late
+# in the run get whatever is left of it instead of the full TIMEOUT
+DEADLINE = 15
+
+# Number of loaded files the data check lists by name
+FILE_PREVIEW = 5
+
+# One pooled session for all checks, so requests to the same host reuse a
+# keep-alive connection instead of opening a new one per check
+SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=20)
+SESSION.mount("http://", _ADAPTER)
+SESSION.mount("https://", _ADAPTER)
+atexit.register(SESSION.close)
+
+# Headers of SPARQL queries. They carry the graph explorer's Origin, as its
+# own queries do, so the response includes the CORS headers the CORS check
+# looks at
+_QUERY_HEADERS = {
+    "Content-Type": "application/json",
+    "Origin": GRAPH_EXPLORER_URL
+}
+
+# Probe queries, with their /query request bodies serialized once up front
+_PROBE_QUERY = "SELECT ?s ?p ?o WHERE { ?s ?p ?o } LIMIT 1"
+_OWL_QUERY = """
+PREFIX owl: <http://www.w3.org/2002/07/owl#>
+PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+
+SELECT ?class ?label WHERE {
+    ?class a owl:Class .
+    OPTIONAL { ?class rdfs:label ?label }
+} LIMIT 10
+"""
+_PROBE_BODY = json.dumps({"query": _PROBE_QUERY}).encode()
+_OWL_BODY = json.dumps({"query": _OWL_QUERY}).encode()
+
+# Monotonic time the current verification run must finish by
+_deadline = float('inf')
+
 
 def print_header(text: str):
     """Print a formatted header."""
@@ -43,6 +101,71 @@ def print_info(text: str):
     print(f"ℹ {text}")
 
 
+def _timeout() -> float:
+    """Timeout for the next request: TIMEOUT, capped by the time left in the run."""
+    return max(0.1, min(TIMEOUT, _deadline - time.monotonic()))
+
+
+def _wait_for(check: Future) -> Tuple[bool, str]:
+    """
+    Wait for a check's result until the run's deadline.
+    
+    A check still running at the deadline is reported as failed; it is
+    left to finish in the background rather than cancelled. Anything a
+    check returns after its success and message is not reported.
+    
+    Args:
+        check: Future of a submitted check
+    
+    Returns:
+        Tuple of (success, message)
+    """
+    try:
+        return check.result(timeout=max(0.0, _deadline - time.monotonic()))[:2]
+    except FutureTimeoutError:
+        return False, f"Timed out: verification took longer than {DEADLINE} seconds"
+
+
+def _cors_headers_of(response: requests.Response) -> Dict[str, Optional[str]]:
+    """Access-Control-* headers of an API response, by name."""
+    return {
+        "Access-Control-Allow-Origin": response.headers.get("Access-Control-Allow-Origin"),
+        "Access-Control-Allow-Methods": response.headers.get("Access-Control-Allow-Methods"),
+        "Access-Control-Allow-Headers": response.headers.get("Access-Control-Allow-Headers")
+    }
+
+
+def _run_sparql(
+    query: str,
+    body: Optional[bytes] = None
+) -> Tuple[int, Any, Dict[str, Optional[str]]]:
+    """
+    Run a SPARQL query against the API and parse the JSON response.
+    
+    Args:
+        query: SPARQL query string
+        body: JSON request body for the query, if already serialized
+    
+    Returns:
+        Tuple of (status code, parsed JSON body or None if not 200,
+        CORS headers of the response)
+    """
+    if body is None:
+        body = json.dumps({"query": query}).encode()
+    
+    response = SESSION.post(
+        f"{API_BASE_URL}/query",
+        data=body,
+        headers=_QUERY_HEADERS,
+        timeout=_timeout()
+    )
+    cors_headers = _cors_headers_of(response)
+    if response.status_code != 200:
+        return response.status_code, None, cors_headers
+    
+    return 200, _loads(response.content), cors_headers
+
+
 def check_api_health() -> Tuple[bool, str]:
     """
     Check if the Python API is healthy and responding.
@@ -51,10 +174,10 @@ def check_api_health() -> Tuple[bool, str]:
         Tuple of (success, message)
     """
     try:
-        response = requests.get(f"{API_BASE_URL}/health", timeout=TIMEOUT)
+        response = SESSION.get(f"{API_BASE_URL}/health", timeout=_timeout())
         
         if response.status_code == 200:
-            data = response.json()
+            data = _loads(response.content)
             if data.get('success'):
                 return True, "Python API is healthy"
             else:
@@ -78,9 +201,14 @@ def check_graph_explorer() -> Tuple[bool, str]:
         Tuple of (success, message)
     """
     try:
-        response = requests.get(GRAPH_EXPLORER_URL, timeout=TIMEOUT)
+        # Only the status matters, so skip downloading the page and bundle
+        response = SESSION.head(
+            GRAPH_EXPLORER_URL,
+            timeout=_timeout(),
+            allow_redirects=True
+        )
         
-        if response.status_code == 200:
+        if response.status_code < 400:
             return True, "Graph explorer is accessible"
         else:
             return False, f"Graph explorer returned status code {response.status_code}"
@@ -93,78 +221,155 @@ def check_graph_explorer() -> Tuple[bool, str]:
         return False, f"Error checking graph explorer: {str(e)}"
 
 
-def check_sparql_endpoint() -> Tuple[bool, str]:
+def check_sparql_endpoint() -> Tuple[bool, str, Optional[Dict[str, Optional[str]]]]:
     """
     Check if the SPARQL endpoint is working.
     
     Returns:
-        Tuple of (success, message)
+        Tuple of (success, message, CORS headers of the query response, or
+        None if no response was received)
     """
-    query = "SELECT ?s ?p ?o WHERE { ?s ?p ?o } LIMIT 1"
-    
     try:
         # Test with JSON format (what graph explorer uses)
-        response = requests.post(
-            f"{API_BASE_URL}/query",
-            json={"query": query},
-            headers={"Content-Type": "application/json"},
-            timeout=TIMEOUT
-        )
+        status_code, data, cors_headers = _run_sparql(_PROBE_QUERY, _PROBE_BODY)
         
-        if response.status_code == 200:
-            data = response.json()
-            
+        if status_code == 200:
             # Check if it's SPARQL JSON format
             if "head" in data and "results" in data:
-                return True, "SPARQL endpoint returns correct format"
+                return True, "SPARQL endpoint returns correct format", cors_headers
             else:
-                return False, f"SPARQL endpoint returns unexpected format: {data}"
+                return False, f"SPARQL endpoint returns unexpected format: {data}", cors_headers
         else:
-            return False, f"SPARQL endpoint returned status code {response.status_code}"
+            return False, f"SPARQL endpoint returned status code {status_code}", cors_headers
             
     except requests.exceptions.ConnectionError:
-        return False, "Cannot connect to SPARQL endpoint"
+        return False, "Cannot connect to SPARQL endpoint", None
     except requests.exceptions.Timeout:
-        return False, "SPARQL query timed out"
+        return False, "SPARQL query timed out", None
     except Exception as e:
-        return False, f"Error testing SPARQL endpoint: {str(e)}"
+        return False, f"Error testing SPARQL endpoint: {str(e)}", None
+
+
+def check_cors_from_headers(cors_headers: Dict[str, Optional[str]]) -> Tuple[bool, str]:
+    """
+    Check CORS headers already received from the API.
+    
+    Args:
+        cors_headers: Access-Control-* response headers by name
+    
+    Returns:
+        Tuple of (success, message)
+    """
+    if cors_headers["Access-Control-Allow-Origin"]:
+        return True, f"CORS is enabled: {cors_headers['Access-Control-Allow-Origin']}"
+    else:
+        return False, "CORS headers not found in response"
 
 
-def check_cors() -> Tuple[bool, str]:
+def check_cors(sparql_result: Optional[Tuple] = None) -> Tuple[bool, str]:
     """
     Check if CORS is properly configured.
     
+    Uses the CORS headers of the SPARQL check's query response when it has
+    them; otherwise sends a preflight request. Not called when
+    /diagnostics answers the CORS check.
+    
+    Args:
+        sparql_result: Result of the SPARQL endpoint check, if it ran
+    
     Returns:
         Tuple of (success, message)
     """
+    if sparql_result is not None and len(sparql_result) > 2 and sparql_result[2] is not None:
+        return check_cors_from_headers(sparql_result[2])
+    
     try:
         # Send OPTIONS request to check CORS
-        response = requests.options(
+        response = SESSION.options(
             f"{API_BASE_URL}/query",
             headers={
-                "Origin": "http://localhost:3000",
+                "Origin": GRAPH_EXPLORER_URL,
                 "Access-Control-Request-Method": "POST",
                 "Access-Control-Request-Headers": "Content-Type"
             },
-            timeout=TIMEOUT
+            timeout=_timeout()
         )
         
-        # Check for CORS headers
-        cors_headers = {
-            "Access-Control-Allow-Origin": response.headers.get("Access-Control-Allow-Origin"),
-            "Access-Control-Allow-Methods": response.headers.get("Access-Control-Allow-Methods"),
-            "Access-Control-Allow-Headers": response.headers.get("Access-Control-Allow-Headers")
-        }
-        
-        if cors_headers["Access-Control-Allow-Origin"]:
-            return True, f"CORS is enabled: {cors_headers['Access-Control-Allow-Origin']}"
-        else:
-            return False, "CORS headers not found in response"
+        return check_cors_from_headers(_cors_headers_of(response))
             
     except Exception as e:
         return False, f"Error checking CORS: {str(e)}"
 
 
+def _read_triples_summary(response: requests.Response) -> Tuple[Any, int, List[str], Any]:
+    """
+    Read the fields the data check needs from a /triples response.
+    
+    With ijson installed the body is parsed as it streams in, and reading
+    stops once the fields are found, without building the whole document;
+    otherwise the body is parsed in full.
+    
+    Args:
+        response: Streamed /triples response
+    
+    Returns:
+        Tuple of (success flag, file count, first FILE_PREVIEW loaded
+        files, error message if the API reported one)
+    """
+    if ijson is None:
+        data = _loads(response.content)
+        details = data.get('data', {})
+        files = details.get('loaded_files', [])[:FILE_PREVIEW]
+        error = data.get('error', {}).get('message')
+        return data.get('success'), details.get('file_count', 0), files, error
+    
+    success = None
+    file_count = None
+    files = []
+    files_done = False
+    error = None
+    
+    response.raw.decode_content = True
+    for prefix, event, value in ijson.parse(response.raw):
+        if prefix == 'success':
+            success = value
+        elif prefix == 'data.file_count':
+            file_count = value
+        elif prefix == 'data.loaded_files.item' and len(files) < FILE_PREVIEW:
+            files.append(value)
+        elif prefix == 'data.loaded_files' and event == 'end_array':
+            files_done = True
+        elif prefix == 'error.message':
+            error = value
+        
+        if success is False and error is not None:
+            break
+        if success and file_count is not None and (files_done or len(files) == FILE_PREVIEW):
+            break
+    
+    return success, file_count or 0, files, error
+
+
+def _data_loaded_result(file_count: int, files: List[str]) -> Tuple[bool, str]:
+    """
+    Report the loaded data, naming at most FILE_PREVIEW of the files.
+    
+    Args:
+        file_count: Number of loaded files
+        files: Names of loaded files, in load order (may be truncated)
+    
+    Returns:
+        Tuple of (success, message)
+    """
+    if file_count <= 0:
+        return False, "No RDF data loaded (load ontology files first)"
+    
+    names = ', '.join(files[:FILE_PREVIEW])
+    if file_count > min(len(files), FILE_PREVIEW):
+        names += ', ...'
+    return True, f"Data loaded: {file_count} files ({names})"
+
+
 def check_data_loaded() -> Tuple[bool, str]:
     """
     Check if RDF data is loaded in the API.
@@ -173,23 +378,17 @@ def check_data_loaded() -> Tuple[bool, str]:
         Tuple of (success, message)
     """
     try:
-        response = requests.get(f"{API_BASE_URL}/triples", timeout=TIMEOUT)
-        
-        if response.status_code == 200:
-            data = response.json()
+        # Streamed so that only the fields needed are read from the body
+        with SESSION.get(f"{API_BASE_URL}/triples", timeout=_timeout(), stream=True) as response:
+            if response.status_code != 200:
+                return False, f"Triples endpoint returned status code {response.status_code}"
             
-            if data.get('success'):
-                file_count = data.get('data', {}).get('file_count', 0)
-                
-                if file_count > 0:
-                    files = data.get('data', {}).get('loaded_files', [])
-                    return True, f"Data loaded: {file_count} files ({', '.join(files)})"
-                else:
-                    return False, "No RDF data loaded (load ontology files first)"
-            else:
-                return False, f"API returned error: {data}"
+            success, file_count, files, error = _read_triples_summary(response)
+        
+        if success:
+            return _data_loaded_result(file_count, files)
         else:
-            return False, f"Triples endpoint returned status code {response.status_code}"
+            return False, f"API returned error: {error}"
             
     except Exception as e:
         return False, f"Error checking loaded data: {str(e)}"
@@ -202,27 +401,10 @@ def check_owl_classes() -> Tuple[bool, str]:
     Returns:
         Tuple of (success, message)
     """
-    query = """
-    PREFIX owl: <http://www.w3.org/2002/07/owl#>
-    PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-    
-    SELECT ?class ?label WHERE {
-        ?class a owl:Class .
-        OPTIONAL { ?class rdfs:label ?label }
-    } LIMIT 10
-    """
-    
     try:
-        response = requests.post(
-            f"{API_BASE_URL}/query",
-            json={"query": query},
-            headers={"Content-Type": "application/json"},
-            timeout=TIMEOUT
-        )
+        status_code, data, _ = _run_sparql(_OWL_QUERY, _OWL_BODY)
         
-        if response.status_code == 200:
-            data = response.json()
-            
+        if status_code == 200:
             if "results" in data and "bindings" in data["results"]:
                 bindings = data["results"]["bindings"]
                 count = len(bindings)
@@ -234,88 +416,232 @@ def check_owl_classes() -> Tuple[bool, str]:
             else:
                 return False, f"Unexpected query response format: {data}"
         else:
-            return False, f"Query returned status code {response.status_code}"
+            return False, f"Query returned status code {status_code}"
             
     except Exception as e:
         return False, f"Error querying OWL classes: {str(e)}"
 
 
-def run_verification():
-    """Run all verification checks."""
-    print_header("Graph Explorer Configuration Verification")
+def check_all_via_diagnostics() -> Optional[Dict[str, Tuple[bool, str]]]:
+    """
+    Run the API-side checks with a single request to /diagnostics.
     
-    print_info("This script verifies the graph explorer integration with the Python API")
-    print_info(f"API URL: {API_BASE_URL}")
-    print_info(f"Graph Explorer URL: {GRAPH_EXPLORER_URL}")
+    The endpoint reports API health, the loaded data and the SPARQL probe
+    results in one response, replacing the separate health, SPARQL, data
+    and OWL class requests. The request carries the graph explorer's
+    Origin, so CORS is checked from the headers of the same response. The
+    graph explorer is still checked separately since it is another host.
     
-    # Track results
-    checks = []
+    Returns:
+        Dictionary of check name -> (success, message) for "API Health",
+        "SPARQL Endpoint", "CORS", "Data Loaded" and "OWL Classes"; only
+        "API Health" if the API could not be checked; None if the API has
+        no /diagnostics endpoint
+    """
+    try:
+        response = SESSION.get(
+            f"{API_BASE_URL}/diagnostics",
+            headers={"Origin": GRAPH_EXPLORER_URL},
+            timeout=_timeout()
+        )
+        
+        if response.status_code == 404:
+            # Older API without the endpoint; use the individual checks
+            return None
+        if response.status_code != 200:
+            return {"API Health": (False, f"API returned status code {response.status_code}")}
+        
+        body = _loads(response.content)
+        if not body.get('success'):
+            return {"API Health": (False, f"API returned unhealthy status: {body}")}
+        
+        data = body.get('data', {})
+        results = {"API Health": (True, "Python API is healthy")}
+        
+        if data.get('sparql_format_ok'):
+            results["SPARQL Endpoint"] = (True, "SPARQL endpoint returns correct format")
+        else:
+            error = data.get('sparql_error', 'unexpected result format')
+            results["SPARQL Endpoint"] = (False, f"SPARQL endpoint check failed: {error}")
+        
+        results["CORS"] = check_cors_from_headers(_cors_headers_of(response))
+        
+        results["Data Loaded"] = _data_loaded_result(
+            data.get('file_count', 0), data.get('loaded_files', [])
+        )
+        
+        count = data.get('owl_class_count', 0)
+        if count > 0:
+            results["OWL Classes"] = (True, f"Found {count} OWL classes (graph explorer will display them)")
+        else:
+            results["OWL Classes"] = (False, "No OWL classes found (ontology may not be loaded)")
+        
+        return results
+        
+    except requests.exceptions.ConnectionError:
+        return {"API Health": (False, "Cannot connect to Python API (is it running?)")}
+    except requests.exceptions.Timeout:
+        return {"API Health": (False, "API health check timed out")}
+    except Exception as e:
+        return {"API Health": (False, f"Error checking API health: {str(e)}")}
+
+
+def _from_diagnostics(
+    diagnostics: Future,
+    name: str,
+    check: Callable[[], Tuple[bool, str]]
+) -> Tuple[bool, str]:
+    """
+    Take a check's result from /diagnostics, or run the check itself.
     
-    # Check 1: API Health
-    print_header("1. Checking Python API Health")
-    success, message = check_api_health()
-    checks.append(("API Health", success))
+    Args:
+        diagnostics: Future of check_all_via_diagnostics()
+        name: Check name in the diagnostics results
+        check: Check function to run if /diagnostics is not available
     
-    if success:
-        print_success(message)
-    else:
-        print_error(message)
-        print_info("Start the API with: docker-compose up -d ontology-api")
+    Returns:
+        Tuple of (success, message)
+    """
+    results = diagnostics.result()
+    if results is None:
+        return check()
+    return results[name]
+
+
+def _run_if_passed(
+    prerequisite: Future,
+    check: Callable[[], Tuple[bool, str]],
+    reason: str
+) -> Tuple[bool, str]:
+    """
+    Run a check once its prerequisite check has passed.
     
-    # Check 2: Graph Explorer
-    print_header("2. Checking Graph Explorer Accessibility")
-    success, message = check_graph_explorer()
-    checks.append(("Graph Explorer", success))
+    If the prerequisite failed, the check would fail the same way (often
+    only after waiting for TIMEOUT), so it is skipped instead.
     
-    if success:
-        print_success(message)
-    else:
-        print_error(message)
-        print_info("Start graph explorer with: docker-compose up -d graph-explorer")
+    Args:
+        prerequisite: Future of the check this one depends on
+        check: Check function to run
+        reason: Why the check is skipped if the prerequisite failed
+    
+    Returns:
+        Tuple of (success, message)
+    """
+    if not prerequisite.result()[0]:
+        return False, f"Skipped: {reason}"
+    return check()
+
+
+def _with_result_of(
+    source: Future,
+    check: Callable[[Tuple], Tuple[bool, str]]
+) -> Tuple[bool, str]:
+    """
+    Run a check on the result of an earlier check.
     
-    # Check 3: SPARQL Endpoint
-    print_header("3. Checking SPARQL Endpoint")
-    success, message = check_sparql_endpoint()
-    checks.append(("SPARQL Endpoint", success))
+    Args:
+        source: Future of the check whose result is used
+        check: Check function taking that result
     
-    if success:
-        print_success(message)
-    else:
-        print_error(message)
-        print_info("Verify the /query endpoint is working correctly")
+    Returns:
+        Tuple of (success, message)
+    """
+    return check(source.result())
+
+
+class _Check(NamedTuple):
+    """A verification check and how it is run and reported."""
+    name: str
+    title: str
+    run: Callable[[], Tuple[bool, str]]
+    hint: str
+    requires: Optional[str] = None
+    diagnosed: bool = False
+    uses: Optional[str] = None
+
+
+# Checks in report order. name appears in the summary, title in the
+# section header and hint is printed when the check fails. requires names
+# an earlier check that must pass first; diagnosed checks are answered by
+# /diagnostics when the API has it. uses names an earlier check whose
+# result is passed to run when the check runs itself.
+_CHECKS = (
+    _Check("API Health", "Python API Health", check_api_health,
+           "Start the API with: docker-compose up -d ontology-api",
+           diagnosed=True),
+    _Check("Graph Explorer", "Graph Explorer Accessibility", check_graph_explorer,
+           "Start graph explorer with: docker-compose up -d graph-explorer"),
+    _Check("SPARQL Endpoint", "SPARQL Endpoint", check_sparql_endpoint,
+           "Verify the /query endpoint is working correctly",
+           requires="API Health", diagnosed=True),
+    _Check("CORS", "CORS Configuration", check_cors,
+           "CORS must be enabled for graph explorer to work",
+           requires="API Health", diagnosed=True, uses="SPARQL Endpoint"),
+    _Check("Data Loaded", "RDF Data", check_data_loaded,
+           "Load data with: curl -X POST http://localhost:8000/load -H 'Content-Type: application/json' -d '{\"files\": [\"ontology/core.ttl\"]}'",
+           requires="API Health", diagnosed=True),
+    _Check("OWL Classes", "OWL Classes", check_owl_classes,
+           "Ensure your ontology files contain OWL classes",
+           requires="Data Loaded", diagnosed=True),
+)
+
+# Why a check is skipped, by the prerequisite that failed
+_SKIP_REASONS = {
+    "API Health": "Python API is not available",
+    "Data Loaded": "no RDF data loaded",
+}
+
+
+def run_verification():
+    """Run all verification checks."""
+    global _deadline
+    _deadline = time.monotonic() + DEADLINE
     
-    # Check 4: CORS
-    print_header("4. Checking CORS Configuration")
-    success, message = check_cors()
-    checks.append(("CORS", success))
+    print_header("Graph Explorer Configuration Verification")
     
-    if success:
-        print_success(message)
-    else:
-        print_error(message)
-        print_info("CORS must be enabled for graph explorer to work")
+    print_info("This script verifies the graph explorer integration with the Python API")
+    print_info(f"API URL: {API_BASE_URL}")
+    print_info(f"Graph Explorer URL: {GRAPH_EXPLORER_URL}")
     
-    # Check 5: Data Loaded
-    print_header("5. Checking RDF Data")
-    success, message = check_data_loaded()
-    checks.append(("Data Loaded", success))
+    # The checks are network round-trips, so start them all at once;
+    # results are still reported in order below as each one finishes.
+    # Checks marked diagnosed come from one /diagnostics request when the
+    # API has that endpoint, and checks with a prerequisite are skipped if
+    # it failed. There is one worker per task, so a waiting task never
+    # holds up the task it waits for.
+    executor = ThreadPoolExecutor(max_workers=len(_CHECKS) + 1)
+    diagnostics = executor.submit(check_all_via_diagnostics)
     
-    if success:
-        print_success(message)
-    else:
-        print_error(message)
-        print_info("Load data with: curl -X POST http://localhost:8000/load -H 'Content-Type: application/json' -d '{\"files\": [\"ontology/core.ttl\"]}'")
+    futures: Dict[str, Future] = {}
+    for check in _CHECKS:
+        run = check.run
+        if check.uses is not None:
+            run = functools.partial(_with_result_of, futures[check.uses], run)
+        if check.diagnosed:
+            run = functools.partial(_from_diagnostics, diagnostics, check.name, run)
+        if check.requires is None:
+            futures[check.name] = executor.submit(run)
+        else:
+            futures[check.name] = executor.submit(
+                _run_if_passed, futures[check.requires], run,
+                _SKIP_REASONS[check.requires]
+            )
+    # Already submitted checks keep running; this only stops new work
+    executor.shutdown(wait=False)
     
-    # Check 6: OWL Classes
-    print_header("6. Checking OWL Classes")
-    success, message = check_owl_classes()
-    checks.append(("OWL Classes", success))
+    # Track results
+    checks = []
     
-    if success:
-        print_success(message)
-    else:
-        print_error(message)
-        print_info("Ensure your ontology files contain OWL classes")
+    for i, check in enumerate(_CHECKS, 1):
+        print_header(f"{i}. Checking {check.title}")
+        success, message = _wait_for(futures[check.name])
+        checks.append((check.name, success))
+        
+        if success:
+            print_success(message)
+        else:
+            print_error(message)
+            print_info(check.hint)
     
     # Summary
     print_header("Verification Summary")
@@ -1,4 +1,13 @@
-"""Quick verification of validator implementation"""
+"""Quick verification of validator implementation
+
+Usage:
+    python verify_validator.py [repeat]
+
+repeat runs the validation that many times on the same validator, as a
+quick sanity check of repeated validation.
+"""
+import argparse
+import functools
 import sys
 sys.path.insert(0, 'src')
 
@@ -10,50 +19,92 @@ from ontology.validator import (
     create_validator
 )
 
-print("Validator Implementation Verification")
-print("=" * 60)
-
-# 1. Check classes are available
-print("\n1. Classes available:")
-print(f"   - SHACLValidator: {SHACLValidator}")
-print(f"   - ValidationReport: {ValidationReport}")
-print(f"   - ValidationResult: {ValidationResult}")
-print(f"   - SeverityLevel: {SeverityLevel}")
-
-# 2. Check severity levels
-print("\n2. Severity levels:")
-for level in SeverityLevel.all_levels():
-    print(f"   - {SeverityLevel.get_label(level)}: {level}")
-
-# 3. Create validator
-print("\n3. Creating validator...")
-validator = create_validator()
-print(f"   - Validator created: {type(validator).__name__}")
-
-# 4. Check statistics
-print("\n4. Validator statistics:")
-stats = validator.get_statistics()
-for key, value in stats.items():
-    if key != 'shape_files':
-        print(f"   - {key}: {value}")
-
-# 5. Execute validation
-print("\n5. Executing validation...")
-report = validator.validate()
-print(f"   - Report: {report}")
-
-# 6. Check report methods
-print("\n6. Report methods:")
-print(f"   - is_valid: {validator.is_valid(report)}")
-print(f"   - get_violations: {len(report.get_violations())} violations")
-print(f"   - get_warnings: {len(report.get_warnings())} warnings")
-print(f"   - get_info: {len(report.get_info())} info")
-
-# 7. Export report
-print("\n7. Exporting report...")
-validator.export_report(report, "output/verify_report.ttl")
-print("   - Report exported successfully")
-
-print("\n" + "=" * 60)
-print("All verification checks passed!")
-print("=" * 60)
+
+@functools.lru_cache(maxsize=1)
+def _cached_validator() -> SHACLValidator:
+    """Create the validator once; later calls (e.g. from tests) reuse it."""
+    return create_validator()
+
+
+def _positive_int(text: str) -> int:
+    """argparse type for the repeat count: an integer of at least 1."""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not an integer: {text!r}")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def main(repeat: int = 1):
+    """Run the verification, validating repeat times (at least once)."""
+    if repeat < 1:
+        raise ValueError(f"repeat must be at least 1, got {repeat}")
+
+    print("Validator Implementation Verification")
+    print("=" * 60)
+
+    # 1. Check classes are available
+    print("\n1. Classes available:")
+    print(f"   - SHACLValidator: {SHACLValidator}")
+    print(f"   - ValidationReport: {ValidationReport}")
+    print(f"   - ValidationResult: {ValidationResult}")
+    print(f"   - SeverityLevel: {SeverityLevel}")
+
+    # 2. Check severity levels
+    print("\n2. Severity levels:")
+    for level in SeverityLevel.all_levels():
+        print(f"   - {SeverityLevel.get_label(level)}: {level}")
+
+    # 3. Create validator
+    print("\n3. Creating validator...")
+    validator = _cached_validator()
+    print(f"   - Validator created: {type(validator).__name__}")
+
+    # 4. Check statistics
+    print("\n4. Validator statistics:")
+    stats = validator.get_statistics()
+    for key, value in stats.items():
+        if key != 'shape_files':
+            print(f"   - {key}: {value}")
+
+    # 5. Execute validation (shapes are parsed once, not per run)
+    print("\n5. Executing validation...")
+    report = validator.validate()
+    for _ in range(repeat - 1):
+        report = validator.validate()
+    if repeat > 1:
+        print(f"   - Validation runs: {repeat}")
+    print(f"   - Report: {report}")
+
+    # 6. Check report methods
+    print("\n6. Report methods:")
+    print(f"   - is_valid: {validator.is_valid(report)}")
+    print(f"   - get_violations: {len(report.get_violations())} violations")
+    print(f"   - get_warnings: {len(report.get_warnings())} warnings")
+    print(f"   - get_info: {len(report.get_info())} info")
+
+    # 7. Export report
+    print("\n7. Exporting report...")
+    validator.export_report(report, "output/verify_report.ttl")
+    print("   - Report exported successfully")
+
+    print("\n" + "=" * 60)
+    print("All verification checks passed!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description='Quick verification of the validator implementation'
+    )
+    parser.add_argument(
+        'repeat',
+        nargs='?',
+        type=_positive_int,
+        default=1,
+        help='Number of validation runs (default: 1)'
+    )
+    args = parser.parse_args()
+    main(args.repeat)